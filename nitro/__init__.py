@@ -21,6 +21,9 @@ def __getattr__(name):
     if name in ("NitroWizard", "WizardStep"):
         from nitro.wizards import NitroWizard, WizardStep
         return locals()[name]
+    if name == "get_cached_loaders":
+        from nitro.checks import get_cached_loaders
+        return get_cached_loaders
     raise AttributeError(f"module 'nitro' has no attribute {name!r}")
 
 
@@ -39,4 +42,5 @@ __all__ = [
     "CurrencyField",
     "NitroWizard",
     "WizardStep",
+    "get_cached_loaders",
 ]
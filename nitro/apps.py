@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class NitroConfig(AppConfig):
     name = "nitro"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        from nitro import checks  # noqa: F401 - registers system checks
@@ -0,0 +1,48 @@
+"""
+Fragment caching for Nitro components.
+
+Rendered component markup is stored in Django's default cache under a key
+built from the component name, its version and the vary-on values. Bumping
+the version with bust() invalidates every fragment for that component at once.
+
+Usage:
+    {% nitro_cache_component 'gallery' property.pk timeout=600 %}
+        {% nitro_gallery photos=property.photos.all %}
+    {% end_nitro_cache_component %}
+
+    # After the photos change
+    from nitro.cache import bust
+    bust('gallery')
+"""
+
+import hashlib
+
+from django.core.cache import cache
+
+DEFAULT_TIMEOUT = 600
+
+
+def _version_key(name):
+    return f'nitro:component-version:{name}'
+
+
+def get_version(name):
+    """Return the current cache version for a component name."""
+    return cache.get(_version_key(name), 1)
+
+
+def make_key(name, vary_on=()):
+    """Build the cache key for a component fragment."""
+    digest = hashlib.sha1(':'.join(str(v) for v in vary_on).encode()).hexdigest()
+    return f'nitro:component:{name}:{get_version(name)}:{digest}'
+
+
+def bust(name):
+    """Invalidate every cached fragment for a component name."""
+    key = _version_key(name)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # No version stored yet: fragments were cached under version 1
+        cache.set(key, 2, None)
+        return 2
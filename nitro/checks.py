@@ -0,0 +1,70 @@
+"""
+Django system checks for Nitro.
+
+Nitro components render through many small partial templates, so a project
+that lists its template loaders explicitly without the cached loader re-parses
+every partial on every render.
+"""
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+CACHED_LOADER = "django.template.loaders.cached.Loader"
+DJANGO_TEMPLATES = "django.template.backends.django.DjangoTemplates"
+
+
+def get_cached_loaders(loaders=None):
+    """
+    Return a loaders setting wrapped in Django's cached loader.
+
+    Args:
+        loaders: Loaders to wrap (defaults to filesystem + app_directories)
+
+    Example:
+        TEMPLATES = [{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'DIRS': [BASE_DIR / 'templates'],
+            'OPTIONS': {'loaders': get_cached_loaders()},
+        }]
+    """
+    if loaders is None:
+        loaders = [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ]
+    return [(CACHED_LOADER, list(loaders))]
+
+
+def _uses_cached_loader(loaders):
+    for loader in loaders:
+        name = loader[0] if isinstance(loader, (list, tuple)) else loader
+        if name == CACHED_LOADER:
+            return True
+    return False
+
+
+@register(Tags.templates)
+def check_template_loaders(app_configs, **kwargs):
+    """Warn when explicit template loaders skip the cached loader in production."""
+    if settings.DEBUG:
+        return []
+
+    errors = []
+    for index, config in enumerate(settings.TEMPLATES):
+        if config.get("BACKEND") != DJANGO_TEMPLATES:
+            continue
+        # Without explicit loaders Django already enables the cached loader
+        loaders = config.get("OPTIONS", {}).get("loaders")
+        if loaders is None or _uses_cached_loader(loaders):
+            continue
+        errors.append(
+            Warning(
+                f"TEMPLATES[{index}] sets 'loaders' without {CACHED_LOADER}.",
+                hint=(
+                    "Nitro tags render many partial templates; wrap your loaders "
+                    "with nitro.get_cached_loaders() so they are parsed once."
+                ),
+                id="nitro.W001",
+            )
+        )
+    return errors
@@ -0,0 +1,31 @@
+"""
+Nitro 0.8 - Middleware.
+
+Usage:
+    # settings.py
+    MIDDLEWARE = [
+        ...
+        'nitro.middleware.TodayMiddleware',
+    ]
+"""
+
+from nitro.utils.dates import cache_today, clear_today
+
+
+class TodayMiddleware:
+    """
+    Compute today() once per request.
+
+    List pages call relative_date/days_until/is_overdue for every row; with this
+    middleware they all share one date instead of calling timezone.now() each time.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        cache_today()
+        try:
+            return self.get_response(request)
+        finally:
+            clear_today()
@@ -23,6 +23,7 @@ Component Tags:
     {% nitro_gallery photos=photo_list columns=3 aspect_ratio='4:3' %}
     {% nitro_inspection_checklist inspection=inspection areas=areas editable=True %}
     {% nitro_inspection_compare inspection1=move_in inspection2=move_out %}
+    {% nitro_cache_component 'gallery' property.pk %}...{% end_nitro_cache_component %}
 
 Display Filters:
     {{ value|status_badge }}
@@ -40,14 +41,29 @@ Utility Tags:
     {% nitro_key 'meta.k' "$dispatch('focus-search')" %}
 """
 
+import json
+import re
+from datetime import datetime, date
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+
 from django import template
+from django.middleware.csrf import get_token
+from django.templatetags.static import static
+from django.urls import reverse
 from django.utils.html import format_html, escape
 from django.utils.safestring import mark_safe
 from django.utils import timezone
-from datetime import datetime, date
+
+from nitro import cache as nitro_cache
 
 register = template.Library()
 
+_NON_DIGITS_RE = re.compile(r'\D+')
+
+# Compact JSON for Alpine x-data payloads (no whitespace to encode or ship)
+_JSON_SEPARATORS = (',', ':')
+
 
 # =============================================================================
 # HTMX ACTION TAGS
@@ -90,21 +106,19 @@ def nitro_filter(context, field, options, target='#list-content', label='', all_
 @register.simple_tag(takes_context=True)
 def nitro_delete(context, url, target='#list-content', confirm='', swap='outerHTML'):
     """Generate hx-delete attributes for a delete button."""
-    attrs = f'hx-delete="{escape(url)}" hx-target="{escape(target)}" hx-swap="{escape(swap)}"'
-    if confirm:
-        attrs += f' hx-confirm="{escape(confirm)}"'
-    return mark_safe(attrs)
+    confirm_attr = f' hx-confirm="{escape(confirm)}"' if confirm else ''
+    return mark_safe(
+        f'hx-delete="{escape(url)}" hx-target="{escape(target)}" hx-swap="{escape(swap)}"{confirm_attr}'
+    )
 
 
 @register.simple_tag(takes_context=True)
 def nitro_form(context, url='', target='#list-content', method='post', swap='outerHTML', encoding=''):
     """Generate hx-* attributes for an HTMX form."""
-    method_lower = method.lower()
-    hx_method = f'hx-{method_lower}'
-    attrs = f'{hx_method}="{escape(url)}" hx-target="{escape(target)}" hx-swap="{escape(swap)}"'
-    if encoding:
-        attrs += f' hx-encoding="{escape(encoding)}"'
-    return mark_safe(attrs)
+    encoding_attr = f' hx-encoding="{escape(encoding)}"' if encoding else ''
+    return mark_safe(
+        f'hx-{method.lower()}="{escape(url)}" hx-target="{escape(target)}" hx-swap="{escape(swap)}"{encoding_attr}'
+    )
 
 
 @register.inclusion_tag('nitro/components/pagination.html', takes_context=True)
@@ -184,18 +198,21 @@ def nitro_field(field, label='', help_text='', css_class=''):
     }
 
 
+# Styling type per widget class name (anything else renders as 'input')
+WIDGET_FIELD_TYPES = {
+    'CheckboxInput': 'checkbox',
+    'Textarea': 'textarea',
+    'Select': 'select',
+    'SelectMultiple': 'select',
+    'FileInput': 'file',
+    'ClearableFileInput': 'file',
+}
+
+
 def _get_field_type(field):
     """Determine field type for styling."""
     widget_class = field.field.widget.__class__.__name__ if hasattr(field, 'field') else ''
-    if widget_class in ('CheckboxInput',):
-        return 'checkbox'
-    if widget_class in ('Textarea',):
-        return 'textarea'
-    if widget_class in ('Select', 'SelectMultiple'):
-        return 'select'
-    if widget_class in ('FileInput', 'ClearableFileInput'):
-        return 'file'
-    return 'input'
+    return WIDGET_FIELD_TYPES.get(widget_class, 'input')
 
 
 @register.inclusion_tag('nitro/components/select_field.html')
@@ -214,8 +231,6 @@ def nitro_select(field, placeholder='Buscar...', search_url='', label='',
         {# Cascade: child depends on parent selection #}
         {% nitro_select form.municipality search_url='/geo/search/?level=6' parent_input='input[name="province"]' cascade_param='parent' %}
     """
-    import json as _json
-
     # Guard: if field is not a valid BoundField, return safe defaults
     if not hasattr(field, 'field'):
         return {
@@ -256,7 +271,7 @@ def nitro_select(field, placeholder='Buscar...', search_url='', label='',
                 current_label = lbl
                 break
 
-    options_json = _json.dumps([{'value': v, 'label': l} for v, l in choices])
+    options_json = json.dumps([{'value': v, 'label': l} for v, l in choices], separators=_JSON_SEPARATORS)
 
     return {
         'field': field,
@@ -307,8 +322,12 @@ def nitro_lazy(context, url, placeholder='spinner', height='200px', trigger='rev
 @register.simple_tag
 def nitro_scripts():
     """Include HTMX, nitro.js, and alpine-components.js scripts."""
-    from django.templatetags.static import static
-    import time
+    return _scripts_html()
+
+
+@lru_cache(maxsize=1)
+def _scripts_html():
+    # Static URLs are fixed for the life of the process, so build the tags once
     # Cache busting version (change when JS is updated)
     v = '0.8.0-beta'
     nitro_js = static('nitro/nitro.js')
@@ -323,21 +342,34 @@ def nitro_scripts():
     return mark_safe(html)
 
 
+# Attributes for closing the enclosing modal/slide-over via its Alpine state
+_CLOSE_ATTRS = mark_safe("@click=\"open = false\" type=\"button\"")
+
+# Open/close button attributes; {id} is the escaped modal/slide-over id
+_OPEN_MODAL_ATTRS = "@click=\"$dispatch('open-modal', '{id}')\" type=\"button\""
+_CLOSE_MODAL_ATTRS = "@click=\"$dispatch('close-modal', '{id}')\" type=\"button\""
+_OPEN_SLIDEOVER_ATTRS = "onclick=\"Nitro.openSlideover('{id}')\" type=\"button\""
+_CLOSE_SLIDEOVER_ATTRS = "onclick=\"Nitro.closeSlideover('{id}')\" type=\"button\""
+
+
+@lru_cache(maxsize=256)
+def _button_attrs(attrs, target_id):
+    """Fill a button attribute template once per id; ids are template literals."""
+    return mark_safe(attrs.format(id=escape(target_id)))
+
+
 @register.simple_tag
 def nitro_open_modal(modal_id):
     """Generate Alpine attributes to open a modal."""
-    return mark_safe(
-        f"@click=\"$dispatch('open-modal', '{escape(modal_id)}')\" "
-        f"type=\"button\""
-    )
+    return _button_attrs(_OPEN_MODAL_ATTRS, modal_id)
 
 
 @register.simple_tag
 def nitro_close_modal(modal_id=''):
     """Generate Alpine attributes to close a modal."""
     if modal_id:
-        return mark_safe(f"@click=\"$dispatch('close-modal', '{escape(modal_id)}')\" type=\"button\"")
-    return mark_safe("@click=\"open = false\" type=\"button\"")
+        return _button_attrs(_CLOSE_MODAL_ATTRS, modal_id)
+    return _CLOSE_ATTRS
 
 
 @register.inclusion_tag('nitro/components/confirm.html')
@@ -363,29 +395,36 @@ def nitro_empty(icon='', title='', message='', action_text='', action_url='', ac
 # BLOCK TAG: nitro_modal / end_nitro_modal
 # =============================================================================
 
+MODAL_SIZES = {
+    'sm': 'max-w-md',
+    'md': 'max-w-lg',
+    'lg': 'max-w-2xl',
+    'xl': 'max-w-4xl',
+}
+
+
 class NitroModalNode(template.Node):
     """Renders a modal wrapper around child content."""
 
+    suffix = (
+        '\n'
+        '    </div>\n'
+        '  </div>\n'
+        '</div>'
+    )
+
     def __init__(self, nodelist, modal_id, title, size):
         self.nodelist = nodelist
         self.modal_id = modal_id
         self.title = title
         self.size = size
+        # With literal arguments (the common case) the wrapper never changes
+        self.prefix = None
+        if not any(hasattr(arg, 'resolve') for arg in (modal_id, title, size)):
+            self.prefix = self.build_prefix(modal_id, title, size)
 
-    def render(self, context):
-        modal_id = self.modal_id.resolve(context) if hasattr(self.modal_id, 'resolve') else self.modal_id
-        title = self.title.resolve(context) if hasattr(self.title, 'resolve') else self.title
-        size = self.size.resolve(context) if hasattr(self.size, 'resolve') else self.size
-
-        inner_content = self.nodelist.render(context)
-
-        size_class = {
-            'sm': 'max-w-md',
-            'md': 'max-w-lg',
-            'lg': 'max-w-2xl',
-            'xl': 'max-w-4xl',
-        }.get(size, 'max-w-lg')
-
+    def build_prefix(self, modal_id, title, size):
+        size_class = MODAL_SIZES.get(size, 'max-w-lg')
         return (
             f'<div x-data="nitroModal(\'{escape(modal_id)}\')" '
             f'x-show="open" x-cloak '
@@ -413,12 +452,19 @@ class NitroModalNode(template.Node):
             f'</svg>\n'
             f'        </button>\n'
             f'      </div>\n'
-            f'      {inner_content}\n'
-            f'    </div>\n'
-            f'  </div>\n'
-            f'</div>'
+            f'      '
         )
 
+    def render(self, context):
+        prefix = self.prefix
+        if prefix is None:
+            modal_id = self.modal_id.resolve(context) if hasattr(self.modal_id, 'resolve') else self.modal_id
+            title = self.title.resolve(context) if hasattr(self.title, 'resolve') else self.title
+            size = self.size.resolve(context) if hasattr(self.size, 'resolve') else self.size
+            prefix = self.build_prefix(modal_id, title, size)
+
+        return f'{prefix}{self.nodelist.render(context)}{self.suffix}'
+
 
 @register.tag('nitro_modal')
 def do_nitro_modal(parser, token):
@@ -464,29 +510,37 @@ def do_nitro_modal(parser, token):
 # BLOCK TAG: nitro_slideover / end_nitro_slideover
 # =============================================================================
 
+SLIDEOVER_SIZES = {
+    'sm': 'max-w-sm',
+    'md': 'max-w-md',
+    'lg': 'max-w-lg',
+    'xl': 'max-w-2xl',
+}
+
+
 class NitroSlideoverNode(template.Node):
     """Renders a slide-over panel (right-side drawer) around child content."""
 
+    suffix = (
+        '\n'
+        '      </div>\n'
+        '    </div>\n'
+        '  </div>\n'
+        '</div>'
+    )
+
     def __init__(self, nodelist, slideover_id, title, size):
         self.nodelist = nodelist
         self.slideover_id = slideover_id
         self.title = title
         self.size = size
+        # With literal arguments (the common case) the wrapper never changes
+        self.prefix = None
+        if not any(hasattr(arg, 'resolve') for arg in (slideover_id, title, size)):
+            self.prefix = self.build_prefix(slideover_id, title, size)
 
-    def render(self, context):
-        sid = self.slideover_id.resolve(context) if hasattr(self.slideover_id, 'resolve') else self.slideover_id
-        title = self.title.resolve(context) if hasattr(self.title, 'resolve') else self.title
-        size = self.size.resolve(context) if hasattr(self.size, 'resolve') else self.size
-
-        inner_content = self.nodelist.render(context)
-
-        size_class = {
-            'sm': 'max-w-sm',
-            'md': 'max-w-md',
-            'lg': 'max-w-lg',
-            'xl': 'max-w-2xl',
-        }.get(size, 'max-w-lg')
-
+    def build_prefix(self, sid, title, size):
+        size_class = SLIDEOVER_SIZES.get(size, 'max-w-lg')
         return (
             f'<div x-data="nitroSlideover(\'{escape(sid)}\')" '
             f'x-show="open" x-cloak '
@@ -523,13 +577,19 @@ class NitroSlideoverNode(template.Node):
             f'      </div>\n'
             # Body - scrollable with safe area for mobile
             f'      <div class="flex-1 overflow-y-auto overscroll-contain px-4 sm:px-6 py-4 pb-safe">\n'
-            f'        {inner_content}\n'
-            f'      </div>\n'
-            f'    </div>\n'
-            f'  </div>\n'
-            f'</div>'
+            f'        '
         )
 
+    def render(self, context):
+        prefix = self.prefix
+        if prefix is None:
+            sid = self.slideover_id.resolve(context) if hasattr(self.slideover_id, 'resolve') else self.slideover_id
+            title = self.title.resolve(context) if hasattr(self.title, 'resolve') else self.title
+            size = self.size.resolve(context) if hasattr(self.size, 'resolve') else self.size
+            prefix = self.build_prefix(sid, title, size)
+
+        return f'{prefix}{self.nodelist.render(context)}{self.suffix}'
+
 
 @register.tag('nitro_slideover')
 def do_nitro_slideover(parser, token):
@@ -572,18 +632,15 @@ def do_nitro_slideover(parser, token):
 @register.simple_tag
 def nitro_open_slideover(slideover_id):
     """Generate attributes to open a slide-over."""
-    return mark_safe(
-        f"onclick=\"Nitro.openSlideover('{escape(slideover_id)}')\" "
-        f"type=\"button\""
-    )
+    return _button_attrs(_OPEN_SLIDEOVER_ATTRS, slideover_id)
 
 
 @register.simple_tag
 def nitro_close_slideover(slideover_id=''):
     """Generate attributes to close a slide-over."""
     if slideover_id:
-        return mark_safe(f"onclick=\"Nitro.closeSlideover('{escape(slideover_id)}')\" type=\"button\"")
-    return mark_safe("@click=\"open = false\" type=\"button\"")
+        return _button_attrs(_CLOSE_SLIDEOVER_ATTRS, slideover_id)
+    return _CLOSE_ATTRS
 
 
 # =============================================================================
@@ -598,13 +655,21 @@ class NitroEditFormNode(template.Node):
         self.url_name = url_name
         self.slideover = slideover
         self.pk_var = pk_var
+        # A literal slide-over id gives a constant hidden input
+        self.slideover_input = None
+        if not hasattr(slideover, 'resolve'):
+            self.slideover_input = self.build_slideover_input(slideover)
 
-    def render(self, context):
-        from django.urls import reverse
+    @staticmethod
+    def build_slideover_input(slideover):
+        return f'<input type="hidden" name="_slideover" value="{escape(slideover)}">'
 
+    def render(self, context):
         # Resolve URL
         url_name = self.url_name.resolve(context) if hasattr(self.url_name, 'resolve') else self.url_name
-        slideover = self.slideover.resolve(context) if hasattr(self.slideover, 'resolve') else self.slideover
+        slideover_input = self.slideover_input
+        if slideover_input is None:
+            slideover_input = self.build_slideover_input(self.slideover.resolve(context))
 
         # Get pk from object in context or from explicit pk variable
         if self.pk_var:
@@ -622,14 +687,13 @@ class NitroEditFormNode(template.Node):
         inner_content = self.nodelist.render(context)
 
         # Get CSRF token
-        from django.middleware.csrf import get_token
         request = context.get('request')
         csrf_token = get_token(request) if request else ''
 
         return (
             f'<form hx-post="{escape(url)}" hx-target="this" hx-swap="outerHTML">\n'
             f'  <input type="hidden" name="csrfmiddlewaretoken" value="{csrf_token}">\n'
-            f'  <input type="hidden" name="_slideover" value="{escape(slideover)}">\n'
+            f'  {slideover_input}\n'
             f'  {inner_content}\n'
             f'</form>'
         )
@@ -728,15 +792,13 @@ def nitro_cascade(url, child_target, include_self=True):
     When the parent select changes, HTMX fetches new <option> elements
     from the URL and swaps them into the child target.
     """
-    attrs = (
+    include_attr = ' hx-include="this"' if include_self else ''
+    return mark_safe(
         f'hx-get="{escape(url)}" '
         f'hx-trigger="change" '
         f'hx-target="{escape(child_target)}" '
-        f'hx-swap="innerHTML"'
+        f'hx-swap="innerHTML"{include_attr}'
     )
-    if include_self:
-        attrs += ' hx-include="this"'
-    return mark_safe(attrs)
 
 
 # =============================================================================
@@ -756,6 +818,76 @@ def currency(value, currency_code=None):
     return _fmt(value, currency_code)
 
 
+# Default status -> (label, color) mappings for status_badge
+STATUS_BADGES = {
+    # Lease/general status
+    'active': ('Activo', 'green'),
+    'draft': ('Borrador', 'gray'),
+    'expired': ('Vencido', 'red'),
+    'cancelled': ('Cancelado', 'red'),
+    'pending': ('Pendiente', 'yellow'),
+    'completed': ('Completado', 'green'),
+    # Property status
+    'available': ('Disponible', 'green'),
+    'rented': ('Alquilada', 'blue'),
+    'maintenance_only': ('Solo Mantenimiento', 'yellow'),
+    'occupied': ('Ocupada', 'purple'),
+    # Payment status
+    'paid': ('Pagado', 'green'),
+    'overdue': ('Atrasado', 'red'),
+    'partial': ('Parcial', 'yellow'),
+    # Work order status
+    'scheduled': ('Programado', 'blue'),
+    'in_progress': ('En Progreso', 'blue'),
+    # Approval
+    'approved': ('Aprobado', 'green'),
+    'rejected': ('Rechazado', 'red'),
+    # Inspection
+    'move_in': ('Entrada', 'blue'),
+    'move_out': ('Salida', 'purple'),
+    'routine': ('Rutina', 'gray'),
+    'damage': ('Daños', 'red'),
+    # Renewal
+    'proposed': ('Propuesto', 'blue'),
+    'negotiating': ('En Negociación', 'yellow'),
+    'accepted': ('Aceptado', 'green'),
+    # Deposit
+    'received': ('Recibido', 'green'),
+    'deduction': ('Deducción', 'red'),
+    'refund': ('Devolución', 'yellow'),
+}
+
+STATUS_BADGE_CLASSES = {
+    'green': 'bg-green-100 text-green-800',
+    'red': 'bg-red-100 text-red-800',
+    'yellow': 'bg-yellow-100 text-yellow-800',
+    'blue': 'bg-blue-100 text-blue-800',
+    'purple': 'bg-purple-100 text-purple-800',
+    'gray': 'bg-gray-100 text-gray-800',
+}
+
+
+@lru_cache(maxsize=256)
+def _badge_html(label, classes):
+    """Build the badge <span> once per (label, classes) and reuse the SafeString."""
+    return mark_safe(
+        f'<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium {classes}">'
+        f'{escape(label)}</span>'
+    )
+
+
+@lru_cache(maxsize=64)
+def _parse_badge_mapping(mapping):
+    """Parse a "key:color,key:color" mapping string (cached per string)."""
+    extra = {}
+    for pair in mapping.split(','):
+        parts = pair.strip().split(':')
+        if len(parts) == 2:
+            key = parts[0].strip()
+            extra[key] = (key, parts[1].strip())
+    return extra
+
+
 @register.filter
 def status_badge(value, mapping=''):
     """
@@ -764,69 +896,17 @@ def status_badge(value, mapping=''):
     Usage: {{ item.status|status_badge }}
     Or with mapping: {{ item.status|status_badge:"active:green,draft:gray,expired:red" }}
     """
-    # Default color mappings
-    color_map = {
-        # Lease/general status
-        'active': ('Activo', 'green'),
-        'draft': ('Borrador', 'gray'),
-        'expired': ('Vencido', 'red'),
-        'cancelled': ('Cancelado', 'red'),
-        'pending': ('Pendiente', 'yellow'),
-        'completed': ('Completado', 'green'),
-        # Property status
-        'available': ('Disponible', 'green'),
-        'rented': ('Alquilada', 'blue'),
-        'maintenance_only': ('Solo Mantenimiento', 'yellow'),
-        'occupied': ('Ocupada', 'purple'),
-        # Payment status
-        'paid': ('Pagado', 'green'),
-        'overdue': ('Atrasado', 'red'),
-        'partial': ('Parcial', 'yellow'),
-        # Work order status
-        'scheduled': ('Programado', 'blue'),
-        'in_progress': ('En Progreso', 'blue'),
-        # Approval
-        'approved': ('Aprobado', 'green'),
-        'rejected': ('Rechazado', 'red'),
-        # Inspection
-        'move_in': ('Entrada', 'blue'),
-        'move_out': ('Salida', 'purple'),
-        'routine': ('Rutina', 'gray'),
-        'damage': ('Daños', 'red'),
-        # Renewal
-        'proposed': ('Propuesto', 'blue'),
-        'negotiating': ('En Negociación', 'yellow'),
-        'accepted': ('Aceptado', 'green'),
-        # Deposit
-        'received': ('Recibido', 'green'),
-        'deduction': ('Deducción', 'red'),
-        'refund': ('Devolución', 'yellow'),
-    }
+    str_value = str(value).lower().strip() if value else ''
 
-    # Parse custom mapping if provided
+    badge = None
     if mapping:
-        for pair in mapping.split(','):
-            parts = pair.strip().split(':')
-            if len(parts) == 2:
-                color_map[parts[0].strip()] = (parts[0].strip(), parts[1].strip())
+        # Custom mapping entries take precedence over the defaults
+        badge = _parse_badge_mapping(mapping).get(str_value)
+    if badge is None:
+        badge = STATUS_BADGES.get(str_value, (str(value), 'gray'))
+    label, color = badge
 
-    str_value = str(value).lower().strip() if value else ''
-    label, color = color_map.get(str_value, (str(value), 'gray'))
-
-    color_classes = {
-        'green': 'bg-green-100 text-green-800',
-        'red': 'bg-red-100 text-red-800',
-        'yellow': 'bg-yellow-100 text-yellow-800',
-        'blue': 'bg-blue-100 text-blue-800',
-        'purple': 'bg-purple-100 text-purple-800',
-        'gray': 'bg-gray-100 text-gray-800',
-    }
-    classes = color_classes.get(color, 'bg-gray-100 text-gray-800')
-
-    return mark_safe(
-        f'<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium {classes}">'
-        f'{escape(label)}</span>'
-    )
+    return _badge_html(label, STATUS_BADGE_CLASSES.get(color, 'bg-gray-100 text-gray-800'))
 
 
 @register.filter
@@ -834,7 +914,7 @@ def phone_format(value):
     """Format phone number: (809) 555-1234"""
     if not value:
         return ''
-    digits = ''.join(c for c in str(value) if c.isdigit())
+    digits = _NON_DIGITS_RE.sub('', str(value))
     if len(digits) == 10:
         return f'({digits[:3]}) {digits[3:6]}-{digits[6:]}'
     if len(digits) == 11 and digits[0] == '1':
@@ -845,8 +925,22 @@ def phone_format(value):
 @register.filter
 def truncate_id(value, length=8):
     """Truncate UUID for display."""
-    s = str(value)
-    return s[:length] if len(s) > length else s
+    return str(value)[:length]
+
+
+PRIORITY_BADGES = {
+    'low': ('Baja', 'gray'),
+    'medium': ('Media', 'yellow'),
+    'high': ('Alta', 'orange'),
+    'urgent': ('Urgente', 'red'),
+}
+
+PRIORITY_BADGE_CLASSES = {
+    'gray': 'bg-gray-100 text-gray-800',
+    'yellow': 'bg-yellow-100 text-yellow-800',
+    'orange': 'bg-orange-100 text-orange-800',
+    'red': 'bg-red-100 text-red-800',
+}
 
 
 @register.filter
@@ -856,34 +950,20 @@ def priority_badge(value):
 
     Usage: {{ ticket.priority|priority_badge }}
     """
-    priority_map = {
-        'low': ('Baja', 'gray'),
-        'medium': ('Media', 'yellow'),
-        'high': ('Alta', 'orange'),
-        'urgent': ('Urgente', 'red'),
-    }
-
     str_value = str(value).lower().strip() if value else ''
-    label, color = priority_map.get(str_value, (str(value), 'gray'))
-
-    color_classes = {
-        'gray': 'bg-gray-100 text-gray-800',
-        'yellow': 'bg-yellow-100 text-yellow-800',
-        'orange': 'bg-orange-100 text-orange-800',
-        'red': 'bg-red-100 text-red-800',
-    }
-    classes = color_classes.get(color, 'bg-gray-100 text-gray-800')
-
-    return mark_safe(
-        f'<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium {classes}">'
-        f'{escape(label)}</span>'
-    )
+    label, color = PRIORITY_BADGES.get(str_value, (str(value), 'gray'))
+    return _badge_html(label, PRIORITY_BADGE_CLASSES.get(color, 'bg-gray-100 text-gray-800'))
 
 
 # =============================================================================
 # TABS TAG (HTMX-powered tab navigation)
 # =============================================================================
 
+_TAB_CLASSES = 'whitespace-nowrap py-3 px-1 border-b-2 font-medium text-sm'
+_TAB_ACTIVE_CLASSES = f'{_TAB_CLASSES} border-primary-500 text-primary-600'
+_TAB_INACTIVE_CLASSES = f'{_TAB_CLASSES} border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300'
+
+
 class NitroTabsNode(template.Node):
     """Renders HTMX-powered tab navigation."""
 
@@ -919,24 +999,21 @@ class NitroTabsNode(template.Node):
             if not active_tab and tabs:
                 active_tab = tabs[0]['name']
 
-        html_parts = [
-            f'<div id="{escape(tabs_id)}" class="border-b border-gray-200 mb-4">',
-            '  <nav class="-mb-px flex space-x-6 overflow-x-auto" aria-label="Tabs">',
-        ]
-        for tab in tabs:
-            is_active = tab['name'] == active_tab
-            active_classes = 'border-primary-500 text-primary-600' if is_active else 'border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300'
-            url = f'{request_path}?tab={escape(tab["name"])}'
-            html_parts.append(
-                f'    <button type="button" '
-                f'hx-get="{url}" hx-target="{escape(target)}" hx-push-url="true" '
-                f'class="whitespace-nowrap py-3 px-1 border-b-2 font-medium text-sm {active_classes}">'
-                f'{escape(tab["label"])}</button>'
-            )
-        html_parts.append('  </nav>')
-        html_parts.append('</div>')
-
-        return '\n'.join(html_parts)
+        target_attr = escape(target)
+        buttons = '\n'.join(
+            f'    <button type="button" '
+            f'hx-get="{request_path}?tab={escape(tab["name"])}" hx-target="{target_attr}" hx-push-url="true" '
+            f'class="{_TAB_ACTIVE_CLASSES if tab["name"] == active_tab else _TAB_INACTIVE_CLASSES}">'
+            f'{escape(tab["label"])}</button>'
+            for tab in tabs
+        )
+        return (
+            f'<div id="{escape(tabs_id)}" class="border-b border-gray-200 mb-4">\n'
+            f'  <nav class="-mb-px flex space-x-6 overflow-x-auto" aria-label="Tabs">\n'
+            f'{buttons}\n'
+            f'  </nav>\n'
+            f'</div>'
+        )
 
 
 @register.tag('nitro_tabs')
@@ -981,6 +1058,33 @@ def nitro_tab(context, name='', label='', active=False):
 # DATE INPUT TAG
 # =============================================================================
 
+def _build_date_input_template(has_label, auto_submit, has_css_class):
+    """Assemble the str.format template for one nitro_date_input variant."""
+    html = ''
+    if has_label:
+        html += '<label for="id_{name}" class="block text-sm font-medium text-gray-700 mb-1">{label}</label>'
+    html += '<input type="date" id="id_{name}" name="{name}" value="{value}" '
+    # Only add hx-* attrs if auto_submit is enabled (prevents infinite loops)
+    if auto_submit:
+        html += 'hx-get="{request_path}" hx-trigger="change" hx-target="{target}" hx-include=".nitro-filter-input" hx-push-url="true" '
+    html += (
+        'class="nitro-filter-input px-3 py-2 border border-gray-300 rounded-lg text-sm focus:ring-2 '
+        'focus:ring-primary-500 focus:border-primary-500'
+    )
+    if has_css_class:
+        html += ' {css_class}'
+    return html + '">'
+
+
+# Keyed by (has_label, auto_submit, has_css_class)
+_DATE_INPUT_TEMPLATES = {
+    (has_label, auto_submit, has_css_class): _build_date_input_template(has_label, auto_submit, has_css_class)
+    for has_label in (False, True)
+    for auto_submit in (False, True)
+    for has_css_class in (False, True)
+}
+
+
 @register.simple_tag(takes_context=True)
 def nitro_date_input(context, name, value='', target='#list-content', label='', css_class='', auto_submit=False):
     """
@@ -996,27 +1100,16 @@ def nitro_date_input(context, name, value='', target='#list-content', label='',
     request = context.get('request')
     if not value and request:
         value = request.GET.get(name, '')
-    request_path = request.path if request else ''
 
-    label_html = ''
-    if label:
-        label_html = f'<label for="id_{escape(name)}" class="block text-sm font-medium text-gray-700 mb-1">{escape(label)}</label>'
-
-    extra_class = f' {css_class}' if css_class else ''
-
-    # Only add hx-* attrs if auto_submit is enabled (prevents infinite loops)
-    htmx_attrs = ''
-    if auto_submit:
-        htmx_attrs = f'hx-get="{request_path}" hx-trigger="change" hx-target="{escape(target)}" hx-include=".nitro-filter-input" hx-push-url="true" '
-
-    html = (
-        f'{label_html}'
-        f'<input type="date" id="id_{escape(name)}" name="{escape(name)}" value="{escape(value)}" '
-        f'{htmx_attrs}'
-        f'class="nitro-filter-input px-3 py-2 border border-gray-300 rounded-lg text-sm focus:ring-2 '
-        f'focus:ring-primary-500 focus:border-primary-500{extra_class}">'
-    )
-    return mark_safe(html)
+    tmpl = _DATE_INPUT_TEMPLATES[(bool(label), bool(auto_submit), bool(css_class))]
+    return mark_safe(tmpl.format(
+        name=escape(name),
+        value=escape(value),
+        label=escape(label),
+        target=escape(target),
+        css_class=css_class,
+        request_path=request.path if request else '',
+    ))
 
 
 # =============================================================================
@@ -1054,7 +1147,13 @@ def nitro_avatar(user=None, name='', image_url='', size='md'):
         name = user.get_full_name() or getattr(user, 'username', '')
         image_url = getattr(user, 'avatar_url', '') or ''
 
-    initials = ''.join([n[0].upper() for n in name.split()[:2]]) if name else '?'
+    parts = name.split(None, 2) if name else []
+    if not parts:
+        initials = '?'
+    elif len(parts) == 1:
+        initials = parts[0][:1].upper()
+    else:
+        initials = (parts[0][:1] + parts[1][:1]).upper()
 
     sizes = {
         'xs': 'w-6 h-6 text-xs',
@@ -1081,11 +1180,17 @@ def nitro_export_buttons(context, label='Exportar'):
         {% nitro_export_buttons %}
     """
     request = context.get('request')
-    params = request.GET.copy() if request else {}
-    params.pop('export', None)
+    query_string = ''
+    if request:
+        # Walk GET directly instead of copying the QueryDict just to drop 'export'
+        query_string = urlencode([
+            (key, value)
+            for key, values in request.GET.lists() if key != 'export'
+            for value in values
+        ])
     return {
         'label': label,
-        'query_string': params.urlencode(),
+        'query_string': query_string,
         'request': request,
     }
 
@@ -1229,6 +1334,59 @@ def relative_date(value):
 # TRANSITION PRESETS
 # =============================================================================
 
+# Transition presets for nitro_transition ('enter'/'leave' get the duration appended)
+TRANSITION_PRESETS = {
+    'fade': {
+        'enter': 'transition ease-out',
+        'enter_start': 'opacity-0',
+        'enter_end': 'opacity-100',
+        'leave': 'transition ease-in',
+        'leave_start': 'opacity-100',
+        'leave_end': 'opacity-0',
+    },
+    'slide-up': {
+        'enter': 'transition ease-out',
+        'enter_start': 'opacity-0 translate-y-4',
+        'enter_end': 'opacity-100 translate-y-0',
+        'leave': 'transition ease-in',
+        'leave_start': 'opacity-100 translate-y-0',
+        'leave_end': 'opacity-0 translate-y-4',
+    },
+    'slide-down': {
+        'enter': 'transition ease-out',
+        'enter_start': 'opacity-0 -translate-y-4',
+        'enter_end': 'opacity-100 translate-y-0',
+        'leave': 'transition ease-in',
+        'leave_start': 'opacity-100 translate-y-0',
+        'leave_end': 'opacity-0 -translate-y-4',
+    },
+    'slide-right': {
+        'enter': 'transform transition ease-out',
+        'enter_start': 'translate-x-full',
+        'enter_end': 'translate-x-0',
+        'leave': 'transform transition ease-in',
+        'leave_start': 'translate-x-0',
+        'leave_end': 'translate-x-full',
+    },
+    'slide-left': {
+        'enter': 'transform transition ease-out',
+        'enter_start': '-translate-x-full',
+        'enter_end': 'translate-x-0',
+        'leave': 'transform transition ease-in',
+        'leave_start': 'translate-x-0',
+        'leave_end': '-translate-x-full',
+    },
+    'scale': {
+        'enter': 'transition ease-out',
+        'enter_start': 'opacity-0 scale-95',
+        'enter_end': 'opacity-100 scale-100',
+        'leave': 'transition ease-in',
+        'leave_start': 'opacity-100 scale-100',
+        'leave_end': 'opacity-0 scale-95',
+    },
+}
+
+
 @register.simple_tag
 def nitro_transition(preset='fade', duration='300'):
     """
@@ -1239,74 +1397,46 @@ def nitro_transition(preset='fade', duration='300'):
         <div x-show="open" {% nitro_transition 'slide-up' %}>...</div>
         <div x-show="open" {% nitro_transition 'scale' '200' %}>...</div>
     """
-    presets = {
-        'fade': {
-            'enter': f'transition ease-out duration-{duration}',
-            'enter_start': 'opacity-0',
-            'enter_end': 'opacity-100',
-            'leave': f'transition ease-in duration-{duration}',
-            'leave_start': 'opacity-100',
-            'leave_end': 'opacity-0',
-        },
-        'slide-up': {
-            'enter': f'transition ease-out duration-{duration}',
-            'enter_start': 'opacity-0 translate-y-4',
-            'enter_end': 'opacity-100 translate-y-0',
-            'leave': f'transition ease-in duration-{duration}',
-            'leave_start': 'opacity-100 translate-y-0',
-            'leave_end': 'opacity-0 translate-y-4',
-        },
-        'slide-down': {
-            'enter': f'transition ease-out duration-{duration}',
-            'enter_start': 'opacity-0 -translate-y-4',
-            'enter_end': 'opacity-100 translate-y-0',
-            'leave': f'transition ease-in duration-{duration}',
-            'leave_start': 'opacity-100 translate-y-0',
-            'leave_end': 'opacity-0 -translate-y-4',
-        },
-        'slide-right': {
-            'enter': f'transform transition ease-out duration-{duration}',
-            'enter_start': 'translate-x-full',
-            'enter_end': 'translate-x-0',
-            'leave': f'transform transition ease-in duration-{duration}',
-            'leave_start': 'translate-x-0',
-            'leave_end': 'translate-x-full',
-        },
-        'slide-left': {
-            'enter': f'transform transition ease-out duration-{duration}',
-            'enter_start': '-translate-x-full',
-            'enter_end': 'translate-x-0',
-            'leave': f'transform transition ease-in duration-{duration}',
-            'leave_start': 'translate-x-0',
-            'leave_end': '-translate-x-full',
-        },
-        'scale': {
-            'enter': f'transition ease-out duration-{duration}',
-            'enter_start': 'opacity-0 scale-95',
-            'enter_end': 'opacity-100 scale-100',
-            'leave': f'transition ease-in duration-{duration}',
-            'leave_start': 'opacity-100 scale-100',
-            'leave_end': 'opacity-0 scale-95',
-        },
-    }
+    return _transition_attrs(preset, duration)
 
-    p = presets.get(preset, presets['fade'])
 
-    attrs = (
-        f'x-transition:enter="{p["enter"]}" '
+@lru_cache(maxsize=64)
+def _transition_attrs(preset, duration):
+    """Build the x-transition attributes once per (preset, duration)."""
+    p = TRANSITION_PRESETS.get(preset, TRANSITION_PRESETS['fade'])
+    return mark_safe(
+        f'x-transition:enter="{p["enter"]} duration-{duration}" '
         f'x-transition:enter-start="{p["enter_start"]}" '
         f'x-transition:enter-end="{p["enter_end"]}" '
-        f'x-transition:leave="{p["leave"]}" '
+        f'x-transition:leave="{p["leave"]} duration-{duration}" '
         f'x-transition:leave-start="{p["leave_start"]}" '
         f'x-transition:leave-end="{p["leave_end"]}"'
     )
-    return mark_safe(attrs)
 
 
 # =============================================================================
 # RATING FILTER
 # =============================================================================
 
+_STAR_FILLED = (
+    '<svg class="w-4 h-4 text-amber-400 inline-block" fill="currentColor" viewBox="0 0 20 20">'
+    '<path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"/>'
+    '</svg>'
+)
+_STAR_HALF = (
+    '<svg class="w-4 h-4 text-amber-400 inline-block" fill="currentColor" viewBox="0 0 20 20">'
+    '<defs><linearGradient id="half"><stop offset="50%" stop-color="currentColor"/>'
+    '<stop offset="50%" stop-color="#D1D5DB"/></linearGradient></defs>'
+    '<path fill="url(#half)" d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"/>'
+    '</svg>'
+)
+_STAR_EMPTY = (
+    '<svg class="w-4 h-4 text-gray-300 inline-block" fill="currentColor" viewBox="0 0 20 20">'
+    '<path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"/>'
+    '</svg>'
+)
+
+
 @register.filter
 def rating(value, max_stars=5):
     """
@@ -1331,29 +1461,16 @@ def rating(value, max_stars=5):
     has_half = (value - full) >= 0.5
     empty = max_stars - full - (1 if has_half else 0)
 
-    star_filled = (
-        '<svg class="w-4 h-4 text-amber-400 inline-block" fill="currentColor" viewBox="0 0 20 20">'
-        '<path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"/>'
-        '</svg>'
-    )
-    star_half = (
-        '<svg class="w-4 h-4 text-amber-400 inline-block" fill="currentColor" viewBox="0 0 20 20">'
-        '<defs><linearGradient id="half"><stop offset="50%" stop-color="currentColor"/>'
-        '<stop offset="50%" stop-color="#D1D5DB"/></linearGradient></defs>'
-        '<path fill="url(#half)" d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"/>'
-        '</svg>'
-    )
-    star_empty = (
-        '<svg class="w-4 h-4 text-gray-300 inline-block" fill="currentColor" viewBox="0 0 20 20">'
-        '<path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"/>'
-        '</svg>'
-    )
+    return _rating_html(full, has_half, empty)
 
-    stars = star_filled * full
-    if has_half:
-        stars += star_half
-    stars += star_empty * empty
 
+@lru_cache(maxsize=64)
+def _rating_html(full, has_half, empty):
+    """Build the star markup once per (full, has_half, empty) combination."""
+    stars = _STAR_FILLED * full
+    if has_half:
+        stars += _STAR_HALF
+    stars += _STAR_EMPTY * empty
     return mark_safe(f'<span class="nitro-rating inline-flex items-center">{stars}</span>')
 
 
@@ -1361,6 +1478,10 @@ def rating(value, max_stars=5):
 # DECLARATIVE TABLE TAGS & FILTERS
 # =============================================================================
 
+# Placeholder for empty cells (shared instance, built once)
+_NULL_CELL = mark_safe('<span class="text-gray-400">—</span>')
+
+
 @register.filter
 def table_cell(obj, column):
     """Resolve a column value from an object and apply display formatting.
@@ -1371,7 +1492,7 @@ def table_cell(obj, column):
     value = get_field_value(obj, column.field)
 
     if value is None:
-        return mark_safe('<span class="text-gray-400">—</span>')
+        return _NULL_CELL
 
     display = column.display
     if display == 'currency':
@@ -1399,7 +1520,6 @@ def resolve_url(obj, url_name):
 
     Usage in template: {{ obj|resolve_url:'leasing:property_detail' }}
     """
-    from django.urls import reverse
     try:
         return reverse(url_name, args=[obj.pk])
     except Exception:
@@ -1456,6 +1576,12 @@ def quick_action_icon(icon_name):
 
     Usage in template: {% quick_action_icon action.icon %}
     """
+    return _quick_action_svg(icon_name)
+
+
+@lru_cache(maxsize=64)
+def _quick_action_svg(icon_name):
+    # Rendered once per row per action, but only a handful of icons exist
     from nitro.tables import QUICK_ACTION_ICONS
     svg_path = QUICK_ACTION_ICONS.get(icon_name, '')
     if not svg_path:
@@ -1471,14 +1597,24 @@ def nitro_table(context, target='#list-content'):
 
     Reads columns, row_actions, quick_actions, object_list, and page_obj from the template context.
 
+    Cell values are resolved once per row here and shared by the desktop
+    and mobile layouts, instead of running table_cell twice per cell.
+
     Usage:
         {% nitro_table target='#list-content' %}
     """
+    columns = context.get('columns', [])
+    object_list = context.get('object_list', [])
+    rows = [
+        (obj, [(column, table_cell(obj, column)) for column in columns])
+        for obj in object_list
+    ]
     return {
-        'columns': context.get('columns', []),
+        'columns': columns,
+        'rows': rows,
         'row_actions': context.get('row_actions', []),
         'quick_actions': context.get('quick_actions', []),
-        'object_list': context.get('object_list', []),
+        'object_list': object_list,
         'page_obj': context.get('page_obj'),
         'target': target,
         'request': context.get('request'),
@@ -1520,6 +1656,12 @@ def nitro_key(key, action):
         <div {% nitro_key 'ctrl.k' "$dispatch('focus-search')" %}>
         <body {% nitro_key 'meta.k' "$dispatch('focus-search')" %}>
     """
+    return _key_attr(key, action)
+
+
+@lru_cache(maxsize=256)
+def _key_attr(key, action):
+    """Build the @keydown attribute once per (key, action); shortcuts are template literals."""
     return mark_safe(f'@keydown.{escape(key)}.window="{escape(action)}"')
 
 
@@ -1527,6 +1669,15 @@ def nitro_key(key, action):
 # SPANISH PLURALIZATION FILTER
 # =============================================================================
 
+@lru_cache(maxsize=128)
+def _parse_plural_forms(forms):
+    """Split 'singular,plural' into a (singular, plural) tuple, or None if malformed."""
+    parts = forms.split(',')
+    if len(parts) != 2:
+        return None
+    return parts[0].strip(), parts[1].strip()
+
+
 @register.filter
 def pluralize_es(count, forms):
     """
@@ -1541,12 +1692,10 @@ def pluralize_es(count, forms):
     except (TypeError, ValueError):
         count = 0
 
-    parts = forms.split(',')
-    if len(parts) != 2:
+    pair = _parse_plural_forms(forms)
+    if pair is None:
         return forms
-
-    singular, plural = parts[0].strip(), parts[1].strip()
-    return singular if count == 1 else plural
+    return pair[0] if count == 1 else pair[1]
 
 
 # =============================================================================
@@ -1651,6 +1800,20 @@ def nitro_document_viewer(
     }
 
 
+def _normalize_whatsapp(phone):
+    """Reduce a phone number to wa.me digits ('' if it has no digits)."""
+    digits = _NON_DIGITS_RE.sub('', str(phone))
+    if not digits:
+        return ''
+    # Add country code if 10 digits (assume DR/US)
+    if len(digits) == 10:
+        digits = '1' + digits
+    # Remove leading 00 if present (international format)
+    if digits.startswith('00'):
+        digits = digits[2:]
+    return digits
+
+
 @register.filter
 def whatsapp_clean(phone):
     """
@@ -1663,17 +1826,7 @@ def whatsapp_clean(phone):
     """
     if not phone:
         return ''
-    # Keep only digits
-    digits = ''.join(c for c in str(phone) if c.isdigit())
-    if not digits:
-        return ''
-    # Add country code if 10 digits (assume DR/US)
-    if len(digits) == 10:
-        digits = '1' + digits
-    # Remove leading 00 if present (international format)
-    if digits.startswith('00'):
-        digits = digits[2:]
-    return digits
+    return _normalize_whatsapp(phone)
 
 
 @register.simple_tag
@@ -1692,28 +1845,22 @@ def whatsapp_link(phone, message=''):
     Example output:
         https://wa.me/18095551234?text=Hola%20Juan
     """
-    import urllib.parse
-
     if not phone:
         return ''
+    return _whatsapp_url(str(phone), str(message) if message else '')
+
 
-    # Clean phone number
-    digits = ''.join(c for c in str(phone) if c.isdigit())
+@lru_cache(maxsize=1024)
+def _whatsapp_url(phone, message):
+    # Contact lists repeat the same numbers and reminder text on every render
+    digits = _normalize_whatsapp(phone)
     if not digits:
         return ''
 
-    # Add country code if 10 digits (assume DR/US)
-    if len(digits) == 10:
-        digits = '1' + digits
-
-    # Remove leading 00 if present (international format)
-    if digits.startswith('00'):
-        digits = digits[2:]
-
     base_url = f'https://wa.me/{digits}'
 
     if message:
-        encoded = urllib.parse.quote(str(message))
+        encoded = quote(message)
         return f'{base_url}?text={encoded}'
 
     return base_url
@@ -1799,23 +1946,20 @@ def nitro_inline_create(
         help_text: Help text below the field
         css_class: Additional CSS classes for the container
     """
-    import json as _json
-
     # Build options JSON
     if options is None:
         options = []
-    options_json = _json.dumps([
+    normalized = [
         {'value': str(o.get('value', o.get('id', ''))), 'label': str(o.get('label', o.get('name', '')))}
         for o in options
-    ])
+    ]
+    options_json = json.dumps(normalized, separators=_JSON_SEPARATORS)
 
     # Find current label if value is set
     current_label = ''
     if value:
-        for o in options:
-            if str(o.get('value', o.get('id', ''))) == str(value):
-                current_label = str(o.get('label', o.get('name', '')))
-                break
+        current_value = str(value)
+        current_label = next((o['label'] for o in normalized if o['value'] == current_value), '')
 
     return {
         'name': name,
@@ -1837,6 +1981,64 @@ def nitro_inline_create(
     }
 
 
+# Responsive grid classes per column count
+GALLERY_COLUMNS = {
+    2: 'grid-cols-1 sm:grid-cols-2',
+    3: 'grid-cols-1 sm:grid-cols-2 lg:grid-cols-3',
+    4: 'grid-cols-2 sm:grid-cols-3 lg:grid-cols-4',
+    5: 'grid-cols-2 sm:grid-cols-3 lg:grid-cols-5',
+}
+
+GALLERY_ASPECTS = {
+    '1:1': 'aspect-square',
+    '4:3': 'aspect-[4/3]',
+    '3:2': 'aspect-[3/2]',
+    '16:9': 'aspect-video',
+}
+
+# Attribute fallbacks for model-instance photos, in priority order
+_PHOTO_ATTRS = (
+    ('url', ('url',)),
+    ('thumbnail_url', ('thumbnail_url', 'url')),
+    ('caption', ('caption', 'description')),
+    ('alt', ('alt', 'caption', 'description')),
+    ('category', ('category', 'photo_type')),
+)
+
+
+def _photo_from_dict(photo):
+    url = photo.get('url', '')
+    caption = photo.get('caption', '')
+    return {
+        'url': url,
+        'thumbnail_url': photo.get('thumbnail_url', url),
+        'caption': caption,
+        'alt': photo.get('alt', caption),
+        'category': photo.get('category', ''),
+        'is_main': bool(photo.get('is_main', False)),
+    }
+
+
+def _photo_from_instance(photo):
+    data = {}
+    for key, names in _PHOTO_ATTRS:
+        for name in names:
+            value = getattr(photo, name, '')
+            if value:
+                break
+        data[key] = value
+
+    # Only touch the file field when no explicit URL attribute is set
+    if not (data['url'] and data['thumbnail_url']):
+        image = getattr(photo, 'image', None)
+        image_url = image.url if image else ''
+        data['url'] = data['url'] or image_url
+        data['thumbnail_url'] = data['thumbnail_url'] or image_url
+
+    data['is_main'] = bool(getattr(photo, 'is_main', False) or getattr(photo, 'is_primary', False))
+    return data
+
+
 @register.inclusion_tag('nitro/components/gallery.html')
 def nitro_gallery(photos, columns=3, gap=2, aspect_ratio='4:3', enable_lightbox=True,
                   empty_title='', empty_message=''):
@@ -1868,52 +2070,22 @@ def nitro_gallery(photos, columns=3, gap=2, aspect_ratio='4:3', enable_lightbox=
             {'url': '/media/photo2.jpg', 'thumbnail_url': '/media/photo2_thumb.jpg', 'caption': 'Vista del salon'},
         ]
     """
-    import json as _json
+    # Materialize once: truth-testing a QuerySet before iterating it queries twice
+    photos = list(photos) if photos is not None else []
 
     # Process photos into a consistent format
-    processed_photos = []
-    if photos:
-        for photo in photos:
-            if isinstance(photo, dict):
-                processed_photos.append({
-                    'url': photo.get('url', ''),
-                    'thumbnail_url': photo.get('thumbnail_url', photo.get('url', '')),
-                    'caption': photo.get('caption', ''),
-                    'alt': photo.get('alt', photo.get('caption', '')),
-                    'category': photo.get('category', ''),
-                    'is_main': bool(photo.get('is_main', False)),
-                })
-            elif hasattr(photo, 'url'):
-                # Handle model instances (e.g., PropertyPhoto)
-                processed_photos.append({
-                    'url': getattr(photo, 'url', '') or (photo.image.url if hasattr(photo, 'image') and photo.image else ''),
-                    'thumbnail_url': getattr(photo, 'thumbnail_url', '') or getattr(photo, 'url', '') or (photo.image.url if hasattr(photo, 'image') and photo.image else ''),
-                    'caption': getattr(photo, 'caption', '') or getattr(photo, 'description', ''),
-                    'alt': getattr(photo, 'alt', '') or getattr(photo, 'caption', '') or getattr(photo, 'description', ''),
-                    'category': getattr(photo, 'category', '') or getattr(photo, 'photo_type', ''),
-                    'is_main': bool(getattr(photo, 'is_main', False) or getattr(photo, 'is_primary', False)),
-                })
-
-    # Grid column classes (responsive)
-    column_classes = {
-        2: 'grid-cols-1 sm:grid-cols-2',
-        3: 'grid-cols-1 sm:grid-cols-2 lg:grid-cols-3',
-        4: 'grid-cols-2 sm:grid-cols-3 lg:grid-cols-4',
-        5: 'grid-cols-2 sm:grid-cols-3 lg:grid-cols-5',
-    }
-    grid_classes = column_classes.get(int(columns), column_classes[3])
-
-    # Aspect ratio classes
-    aspect_classes = {
-        '1:1': 'aspect-square',
-        '4:3': 'aspect-[4/3]',
-        '3:2': 'aspect-[3/2]',
-        '16:9': 'aspect-video',
-    }
-    aspect_class = aspect_classes.get(aspect_ratio, aspect_classes['4:3'])
+    # (model instances such as PropertyPhoto need a url attribute)
+    processed_photos = [
+        _photo_from_dict(photo) if isinstance(photo, dict) else _photo_from_instance(photo)
+        for photo in photos
+        if isinstance(photo, dict) or hasattr(photo, 'url')
+    ]
+
+    grid_classes = GALLERY_COLUMNS.get(int(columns), GALLERY_COLUMNS[3])
+    aspect_class = GALLERY_ASPECTS.get(aspect_ratio, GALLERY_ASPECTS['4:3'])
 
     # Convert photos to JSON for Alpine.js
-    photos_json = _json.dumps(processed_photos)
+    photos_json = json.dumps(processed_photos, separators=_JSON_SEPARATORS)
 
     return {
         'photos': processed_photos,
@@ -1943,4 +2115,71 @@ def get_item(dictionary, key):
     """
     if dictionary is None:
         return None
-    return dictionary.get(key, None)
+    try:
+        return dictionary[key]
+    except (KeyError, TypeError):
+        return None
+
+
+# =============================================================================
+# BLOCK TAG: nitro_cache_component / end_nitro_cache_component
+# =============================================================================
+
+class NitroCacheComponentNode(template.Node):
+    """Caches the rendered child content in Django's default cache."""
+
+    def __init__(self, nodelist, name, vary_on, timeout):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+        self.timeout = timeout
+
+    def render(self, context):
+        vary_on = [var.resolve(context) for var in self.vary_on]
+        timeout = self.timeout.resolve(context) if self.timeout else nitro_cache.DEFAULT_TIMEOUT
+        key = nitro_cache.make_key(self.name, vary_on)
+
+        content = nitro_cache.cache.get(key)
+        if content is None:
+            content = self.nodelist.render(context)
+            nitro_cache.cache.set(key, content, int(timeout))
+        return content
+
+
+@register.tag('nitro_cache_component')
+def do_nitro_cache_component(parser, token):
+    """
+    Block tag for caching rendered component markup.
+
+    Usage:
+        {% nitro_cache_component 'gallery' property.pk timeout=600 %}
+            {% nitro_gallery photos=property.photos.all %}
+        {% end_nitro_cache_component %}
+
+    Positional arguments after the name vary the cache key. Invalidate all
+    fragments for a name with nitro.cache.bust('gallery').
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            "nitro_cache_component requires a component name argument"
+        )
+
+    name = bits[1]
+    if len(name) < 2 or name[0] != name[-1] or name[0] not in ('"', "'"):
+        raise template.TemplateSyntaxError(
+            "nitro_cache_component component name must be a quoted string"
+        )
+    name = name[1:-1]
+    vary_on = []
+    timeout = None
+    for bit in bits[2:]:
+        if bit.startswith('timeout='):
+            timeout = parser.compile_filter(bit.split('=', 1)[1])
+        else:
+            vary_on.append(parser.compile_filter(bit))
+
+    nodelist = parser.parse(('end_nitro_cache_component',))
+    parser.delete_first_token()
+
+    return NitroCacheComponentNode(nodelist, name, vary_on, timeout)
@@ -12,6 +12,7 @@ from .dates import (
     today, now, relative_date, date_range, month_name, month_year,
     get_month_range, get_quarter_range, get_year_range,
     days_until, days_since, is_overdue, add_months,
+    get_due_date, get_due_dates,
 )
 
 __all__ = [
@@ -22,4 +23,5 @@ __all__ = [
     'today', 'now', 'relative_date', 'date_range', 'month_name', 'month_year',
     'get_month_range', 'get_quarter_range', 'get_year_range',
     'days_until', 'days_since', 'is_overdue', 'add_months',
+    'get_due_date', 'get_due_dates',
 ]
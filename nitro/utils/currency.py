@@ -12,19 +12,36 @@ Configure default currency in Django settings:
     NITRO_DEFAULT_CURRENCY = 'USD'  # or 'DOP', 'EUR', etc.
 """
 
+import re
+import types
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Union
 
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
 
 def get_default_currency() -> str:
     """Get default currency from Django settings, fallback to 'USD'."""
     try:
-        from django.conf import settings
-        return getattr(settings, 'NITRO_DEFAULT_CURRENCY', 'USD')
+        return _configured_default_currency()
     except Exception:
         return 'USD'
 
 
+@lru_cache(maxsize=1)
+def _configured_default_currency() -> str:
+    return getattr(settings, 'NITRO_DEFAULT_CURRENCY', 'USD')
+
+
+@receiver(setting_changed)
+def _reset_default_currency(*, setting, **kwargs):
+    if setting == 'NITRO_DEFAULT_CURRENCY':
+        _configured_default_currency.cache_clear()
+
+
 # Currency configurations
 CURRENCIES = {
     'DOP': {
@@ -51,6 +68,26 @@ CURRENCIES = {
 }
 
 
+# Rounding exponents per number of decimal places
+_QUANTIZERS = {
+    0: Decimal('1'),
+    2: Decimal('0.01'),
+    3: Decimal('0.001'),
+    4: Decimal('0.0001'),
+}
+
+
+# Default approximate rates to DOP (used by convert_currency)
+DEFAULT_RATES = types.MappingProxyType({
+    'DOP': Decimal('1'),
+    'USD': Decimal('58.5'),
+    'EUR': Decimal('63.0'),
+})
+
+# Rate for currencies missing from the rates table (treated as DOP)
+_ONE = Decimal('1')
+
+
 def get_currency_symbol(currency_code: str) -> str:
     """Get currency symbol for a given code."""
     return CURRENCIES.get(currency_code, {}).get('symbol', currency_code)
@@ -76,6 +113,16 @@ def format_currency(amount: Union[int, float, Decimal, str, None],
     if currency_code is None:
         currency_code = get_default_currency()
 
+    if currency_code not in CURRENCIES:
+        default_currency = get_default_currency()
+        currency_code = default_currency if default_currency in CURRENCIES else 'USD'
+
+    # Whole amounts need no Decimal rounding
+    if type(amount) is int:
+        config = CURRENCIES[currency_code]
+        decimal_part = '0' * config['decimal_places'] or '00'
+        return _join_parts(abs(amount), decimal_part, amount < 0, config, show_symbol)
+
     try:
         if isinstance(amount, str):
             amount = Decimal(amount.replace(',', ''))
@@ -84,13 +131,18 @@ def format_currency(amount: Union[int, float, Decimal, str, None],
     except Exception:
         return str(amount)
 
-    default_currency = get_default_currency()
-    config = CURRENCIES.get(currency_code, CURRENCIES.get(default_currency, CURRENCIES['USD']))
+    return _format_decimal(amount, currency_code, show_symbol)
+
+
+@lru_cache(maxsize=2048)
+def _format_decimal(amount: Decimal, currency_code: str, show_symbol: bool) -> str:
+    """Format a Decimal for a known currency (tables repeat the same amounts)."""
+    config = CURRENCIES[currency_code]
 
     # Round to decimal places
     places = config['decimal_places']
-    quantize_str = '0.' + '0' * places
-    amount = amount.quantize(Decimal(quantize_str), rounding=ROUND_HALF_UP)
+    quantizer = _QUANTIZERS.get(places) or Decimal('0.' + '0' * places)
+    amount = amount.quantize(quantizer, rounding=ROUND_HALF_UP)
 
     # Format number
     is_negative = amount < 0
@@ -99,10 +151,16 @@ def format_currency(amount: Union[int, float, Decimal, str, None],
     integer_part = parts[0]
     decimal_part = parts[1] if len(parts) > 1 else '00'
 
+    return _join_parts(int(integer_part), decimal_part, is_negative, config, show_symbol)
+
+
+def _join_parts(integer_part: int, decimal_part: str, is_negative: bool,
+                config: dict, show_symbol: bool) -> str:
+    """Assemble separators, sign and symbol around an absolute amount."""
     # Add thousand separators
-    reversed_int = integer_part[::-1]
-    groups = [reversed_int[i:i+3] for i in range(0, len(reversed_int), 3)]
-    formatted_int = config['thousand_sep'].join(groups)[::-1]
+    formatted_int = f'{integer_part:,}'
+    if config['thousand_sep'] != ',':
+        formatted_int = formatted_int.replace(',', config['thousand_sep'])
 
     formatted = f"{formatted_int}{config['decimal_sep']}{decimal_part}"
 
@@ -135,17 +193,11 @@ def parse_currency(value: str, currency_code: str = None) -> Decimal:
     config = CURRENCIES.get(currency_code, CURRENCIES.get(default_currency, CURRENCIES['USD']))
 
     # Remove currency symbol and whitespace
-    cleaned = str(value)
-    for curr in CURRENCIES.values():
-        cleaned = cleaned.replace(curr['symbol'], '')
-    cleaned = cleaned.strip()
+    symbols = tuple(curr['symbol'] for curr in CURRENCIES.values())
+    cleaned = _symbols_re(symbols).sub('', str(value)).strip()
 
-    # Remove thousand separators
-    cleaned = cleaned.replace(config['thousand_sep'], '')
-
-    # Normalize decimal separator
-    if config['decimal_sep'] != '.':
-        cleaned = cleaned.replace(config['decimal_sep'], '.')
+    # Remove thousand separators and normalize the decimal separator
+    cleaned = cleaned.translate(_separator_table(config['thousand_sep'], config['decimal_sep']))
 
     try:
         return Decimal(cleaned)
@@ -153,6 +205,18 @@ def parse_currency(value: str, currency_code: str = None) -> Decimal:
         return Decimal('0')
 
 
+@lru_cache(maxsize=8)
+def _symbols_re(symbols: tuple) -> re.Pattern:
+    """Compile one pattern matching any currency symbol (longest first)."""
+    return re.compile('|'.join(re.escape(symbol) for symbol in sorted(symbols, key=len, reverse=True)))
+
+
+@lru_cache(maxsize=8)
+def _separator_table(thousand_sep: str, decimal_sep: str) -> dict:
+    """Translation table dropping thousand separators and mapping the decimal one to '.'."""
+    return str.maketrans({thousand_sep: None, decimal_sep: '.'})
+
+
 def convert_currency(amount: Decimal, from_currency: str, to_currency: str,
                      rates: dict = None) -> Decimal:
     """
@@ -171,22 +235,19 @@ def convert_currency(amount: Decimal, from_currency: str, to_currency: str,
         return amount
 
     if rates is None:
-        # Default approximate rates to DOP
-        rates = {
-            'DOP': Decimal('1'),
-            'USD': Decimal('58.5'),
-            'EUR': Decimal('63.0'),
-        }
+        rates = DEFAULT_RATES
+    else:
+        rates = {code: Decimal(str(rate)) for code, rate in rates.items()}
 
     # Convert to DOP first, then to target
     if from_currency != 'DOP':
-        amount_dop = amount * rates.get(from_currency, Decimal('1'))
+        amount_dop = amount * rates.get(from_currency, _ONE)
     else:
         amount_dop = amount
 
     if to_currency != 'DOP':
-        result = amount_dop / rates.get(to_currency, Decimal('1'))
+        result = amount_dop / rates.get(to_currency, _ONE)
     else:
         result = amount_dop
 
-    return result.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    return result.quantize(_QUANTIZERS[2], rounding=ROUND_HALF_UP)
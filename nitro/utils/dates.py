@@ -9,17 +9,59 @@ Usage:
     month_year(some_date)       # "Enero 2026"
 """
 
+import calendar
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Tuple
 
+from asgiref.local import Local
 from django.utils import timezone
 
+# Spanish month names, indexed by month number (1-12)
+MONTH_NAMES = (
+    '', 'Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio',
+    'Julio', 'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre',
+)
+
+MONTH_ABBREVIATIONS = (
+    '', 'Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun',
+    'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic',
+)
+
+# Days per month in a common year, indexed by month number (1-12)
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# First and last month of each quarter
+QUARTER_MONTHS = {
+    1: (1, 3),
+    2: (4, 6),
+    3: (7, 9),
+    4: (10, 12),
+}
+
+# Holds a per-request today() value while TodayMiddleware is active
+_request_state = Local()
+
 
 def today() -> date:
     """Get today's date (timezone-aware)."""
+    cached = getattr(_request_state, 'today', None)
+    if cached is not None:
+        return cached
     return timezone.now().date()
 
 
+def cache_today() -> date:
+    """Compute today() once and reuse it until clear_today() is called."""
+    _request_state.today = timezone.now().date()
+    return _request_state.today
+
+
+def clear_today() -> None:
+    """Drop the value stored by cache_today()."""
+    _request_state.today = None
+
+
 def now() -> datetime:
     """Get current datetime (timezone-aware)."""
     return timezone.now()
@@ -41,49 +83,56 @@ def relative_date(value: date) -> str:
     today_date = today()
     diff = (value - today_date).days
 
+    label = RELATIVE_DATE_LABELS.get(diff)
+    if label is not None:
+        return label
+
+    return f'{value.day:02d}/{value.month:02d}/{value.year}'
+
+
+def _relative_label(diff: int) -> str:
     if diff == 0:
         return 'Hoy'
     if diff == 1:
         return 'Mañana'
     if diff == -1:
         return 'Ayer'
-    if 1 < diff <= 7:
-        return f'En {diff} días'
-    if -7 <= diff < -1:
-        return f'Hace {abs(diff)} días'
-    if 7 < diff <= 30:
-        weeks = diff // 7
-        return f'En {weeks} semana{"s" if weeks > 1 else ""}'
-    if -30 <= diff < -7:
-        weeks = abs(diff) // 7
-        return f'Hace {weeks} semana{"s" if weeks > 1 else ""}'
+    days = abs(diff)
+    if days <= 7:
+        return f'En {days} días' if diff > 0 else f'Hace {days} días'
+    weeks = days // 7
+    unit = f'{weeks} semana{"s" if weeks > 1 else ""}'
+    return f'En {unit}' if diff > 0 else f'Hace {unit}'
+
 
-    return value.strftime('%d/%m/%Y')
+# relative_date labels for every offset within 30 days of today
+RELATIVE_DATE_LABELS = {diff: _relative_label(diff) for diff in range(-30, 31)}
 
 
 def date_range(start: date, end: date) -> str:
-    """Format date range as string."""
+    """Format date range as string, e.g. "3-9 Ene 2026"."""
+    start_month = MONTH_ABBREVIATIONS[start.month]
+    end_month = MONTH_ABBREVIATIONS[end.month]
     if start.year == end.year:
         if start.month == end.month:
-            return f'{start.day}-{end.day} {start.strftime("%b %Y")}'
-        return f'{start.strftime("%d %b")} - {end.strftime("%d %b %Y")}'
-    return f'{start.strftime("%d %b %Y")} - {end.strftime("%d %b %Y")}'
+            return f'{start.day}-{end.day} {start_month} {start.year}'
+        return f'{start.day:02d} {start_month} - {end.day:02d} {end_month} {end.year}'
+    return f'{start.day:02d} {start_month} {start.year} - {end.day:02d} {end_month} {end.year}'
 
 
 def month_name(month: int) -> str:
     """Get Spanish month name (1-indexed)."""
-    months = [
-        '', 'Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio',
-        'Julio', 'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre',
-    ]
-    return months[month] if 1 <= month <= 12 else ''
+    return MONTH_NAMES[month] if 1 <= month <= 12 else ''
 
 
 def month_year(d: date) -> str:
     """Format date as 'Enero 2026'."""
-    return f'{month_name(d.month)} {d.year}'
+    return f'{MONTH_NAMES[d.month]} {d.year}'
 
 
+# Ranges are pure functions of their integer arguments and date objects are
+# immutable, so results are shared across calls (schedules repeat the same months)
+@lru_cache(maxsize=512)
 def get_month_range(year: int, month: int) -> Tuple[date, date]:
     """Get first and last day of month."""
     first_day = date(year, month, 1)
@@ -96,20 +145,16 @@ def get_month_range(year: int, month: int) -> Tuple[date, date]:
     return first_day, last_day
 
 
+@lru_cache(maxsize=128)
 def get_quarter_range(year: int, quarter: int) -> Tuple[date, date]:
     """Get first and last day of quarter (1-4)."""
-    quarters = {
-        1: (1, 3),
-        2: (4, 6),
-        3: (7, 9),
-        4: (10, 12),
-    }
-    start_month, end_month = quarters.get(quarter, (1, 3))
+    start_month, end_month = QUARTER_MONTHS.get(quarter, (1, 3))
     first_day = date(year, start_month, 1)
     _, last_day = get_month_range(year, end_month)
     return first_day, last_day
 
 
+@lru_cache(maxsize=64)
 def get_year_range(year: int) -> Tuple[date, date]:
     """Get first and last day of year."""
     return date(year, 1, 1), date(year, 12, 31)
@@ -138,11 +183,12 @@ def is_overdue(due_date: date) -> bool:
 
 def add_months(d: date, months: int) -> date:
     """Add (or subtract) months to a date, clamping day to valid range."""
-    month = d.month + months
-    year = d.year + (month - 1) // 12
-    month = ((month - 1) % 12) + 1
-    day = min(d.day, get_days_in_month(year, month))
-    return date(year, month, day)
+    total = d.month - 1 + months
+    year = d.year + total // 12
+    month = total % 12 + 1
+    last_day = 29 if month == 2 and _is_leap(year) else DAYS_IN_MONTH[month]
+    day = d.day
+    return date(year, month, day if day < last_day else last_day)
 
 
 def get_days_in_month(year: int, month: int) -> int:
@@ -155,8 +201,15 @@ def get_days_in_month(year: int, month: int) -> int:
         get_days_in_month(2024, 4) → 30
         get_days_in_month(2024, 1) → 31
     """
-    import calendar
-    return calendar.monthrange(year, month)[1]
+    if not 1 <= month <= 12:
+        raise calendar.IllegalMonthError(month)
+    if month == 2 and _is_leap(year):
+        return 29
+    return DAYS_IN_MONTH[month]
+
+
+def _is_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
 def get_safe_day_of_month(year: int, month: int, desired_day: int) -> int:
@@ -173,8 +226,10 @@ def get_safe_day_of_month(year: int, month: int, desired_day: int) -> int:
         get_safe_day_of_month(2024, 4, 31) → 30 (April has 30 days)
         get_safe_day_of_month(2024, 1, 31) → 31 (January has 31 days)
     """
-    last_day = get_days_in_month(year, month)
-    return min(desired_day, last_day)
+    if not 1 <= month <= 12:
+        raise calendar.IllegalMonthError(month)
+    last_day = 29 if month == 2 and _is_leap(year) else DAYS_IN_MONTH[month]
+    return desired_day if desired_day < last_day else last_day
 
 
 def get_due_date(year: int, month: int, payment_day: int) -> date:
@@ -189,5 +244,32 @@ def get_due_date(year: int, month: int, payment_day: int) -> date:
         get_due_date(2024, 4, 31) → date(2024, 4, 30)
         get_due_date(2024, 3, 15) → date(2024, 3, 15)
     """
-    safe_day = get_safe_day_of_month(year, month, payment_day)
-    return date(year, month, safe_day)
+    if not 1 <= month <= 12:
+        raise calendar.IllegalMonthError(month)
+    last_day = 29 if month == 2 and _is_leap(year) else DAYS_IN_MONTH[month]
+    return date(year, month, payment_day if payment_day < last_day else last_day)
+
+
+def get_due_dates(start: date, count: int, payment_day: int) -> list[date]:
+    """
+    Get ``count`` consecutive monthly due dates starting at ``start``'s month.
+
+    Equivalent to ``get_due_date`` for each month, but steps the year/month
+    in a single loop for bulk schedule generation.
+
+    Examples:
+        get_due_dates(date(2024, 1, 1), 3, 31)
+        → [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31)]
+    """
+    year, month = start.year, start.month
+    dates = []
+    append = dates.append
+    for _ in range(count):
+        last_day = 29 if month == 2 and _is_leap(year) else DAYS_IN_MONTH[month]
+        append(date(year, month, payment_day if payment_day < last_day else last_day))
+        if month == 12:
+            year += 1
+            month = 1
+        else:
+            month += 1
+    return dates
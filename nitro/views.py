@@ -7,19 +7,31 @@ standard Django CBVs that return HTML partials for HTMX requests.
 
 import json
 import logging
+import operator
 from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from functools import cache, lru_cache, reduce
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.contrib.postgres.search import SearchVector, SearchQuery
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.core.signals import setting_changed
+from django.db.models import F, Q
+from django.dispatch import receiver
 from django.http import HttpResponse
-from django.shortcuts import get_object_or_404
+from django.shortcuts import get_object_or_404, redirect
+from django.template.loader import get_template
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.http import url_has_allowed_host_and_scheme
 from django.views import View
 from django.views.generic import TemplateView
 
 logger = logging.getLogger(__name__)
+security_logger = logging.getLogger('security')
 
 
 # =============================================================================
@@ -46,6 +58,138 @@ class Tab:
     badge_color: str = 'gray'  # 'gray', 'primary', 'red', 'amber', 'green'
 
 
+# =============================================================================
+# Template lookup
+# =============================================================================
+
+@lru_cache(maxsize=128)
+def _cached_template(name):
+    return get_template(name)
+
+
+def _get_template(name):
+    """Resolve a template once per process; DEBUG always re-resolves so edits show up."""
+    if settings.DEBUG:
+        return get_template(name)
+    return _cached_template(name)
+
+
+@receiver(setting_changed)
+def _reset_template_cache(*, setting, **kwargs):
+    # Django rebuilds its template engines for these; drop Templates bound to the old ones
+    if setting in {'TEMPLATES', 'DEBUG', 'INSTALLED_APPS'}:
+        _cached_template.cache_clear()
+
+
+# =============================================================================
+# HX-Trigger payloads
+# =============================================================================
+
+_TOAST_TRIGGER = '{"showToast": {"message": %s, "type": %s}}'
+_TOAST_CLOSE_TRIGGER = '{"showToast": {"message": %s, "type": %s}, "closeSlideover": %s}'
+_encode = json.JSONEncoder().encode
+
+
+def _toast_trigger(message, level='success', close_slideover=None):
+    """Build the HX-Trigger JSON for a toast, optionally closing a slideover."""
+    if close_slideover is None:
+        return _TOAST_TRIGGER % (_encode(message), _encode(level))
+    return _TOAST_CLOSE_TRIGGER % (_encode(message), _encode(level), _encode(close_slideover))
+
+
+# =============================================================================
+# Filter lookups
+# =============================================================================
+
+@cache
+def _spans_multivalued(model, lookup):
+    """Whether ``lookup`` traverses a many-to-many or reverse foreign key relation."""
+    opts = model._meta
+    for part in lookup.split('__'):
+        try:
+            f = opts.get_field(part)
+        except FieldDoesNotExist:
+            return False  # Reached a lookup/transform such as __in or __gte
+        if f.many_to_many or f.one_to_many:
+            return True
+        if not f.is_relation or f.related_model is None:
+            return False
+        opts = f.related_model._meta
+    return False
+
+
+# =============================================================================
+# Count-free page for NitroListView (paginate_count = False)
+# =============================================================================
+
+class CountlessPage:
+    """
+    Page of results fetched with LIMIT per_page + 1 instead of COUNT(*).
+
+    Mirrors the parts of django.core.paginator.Page used for prev/next
+    navigation. There is no total, so ``paginator`` is None.
+    """
+
+    paginator = None
+
+    def __init__(self, object_list, number, per_page, has_next):
+        self.object_list = object_list
+        self.number = number
+        self.per_page = per_page
+        self._has_next = has_next
+
+    @classmethod
+    def from_queryset(cls, queryset, number, per_page):
+        try:
+            number = max(int(number), 1)
+        except (TypeError, ValueError):
+            number = 1
+        offset = (number - 1) * per_page
+        rows = list(queryset[offset:offset + per_page + 1])
+        if not rows and number > 1:
+            # Past the end (e.g. the last page's rows were deleted): count once
+            # and fall back to the last page, as Paginator.get_page() does
+            try:
+                count = queryset.count()
+            except (AttributeError, TypeError):
+                count = len(queryset)
+            number = max((count + per_page - 1) // per_page, 1)
+            offset = (number - 1) * per_page
+            rows = list(queryset[offset:offset + per_page + 1])
+        return cls(rows[:per_page], number, per_page, len(rows) > per_page)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.per_page + 1
+
+    def end_index(self):
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.per_page + len(self.object_list)
+
+
 class NitroView(LoginRequiredMixin, TemplateView):
     """
     Base view for all Nitro 0.8 views.
@@ -60,9 +204,10 @@ class NitroView(LoginRequiredMixin, TemplateView):
     template_name = None        # Full page template
     partial_template = None     # Partial for HTMX swaps
 
-    @property
+    @cached_property
     def is_htmx(self):
-        return getattr(self.request, 'htmx', False) and self.request.htmx
+        # Views are instantiated per request, so evaluate the header once
+        return bool(getattr(self.request, 'htmx', False))
 
     def get_template_names(self):
         if self.is_htmx and self.partial_template:
@@ -73,9 +218,8 @@ class NitroView(LoginRequiredMixin, TemplateView):
         """Render the appropriate template (full page or partial)."""
         if context is None:
             context = self.get_context_data(**kwargs)
-        template = self.get_template_names()[0]
-        from django.template.loader import render_to_string
-        html = render_to_string(template, context, request=self.request)
+        template = _get_template(self.get_template_names()[0])
+        html = template.render(context, request=self.request)
         return HttpResponse(html)
 
     def htmx_redirect(self, url):
@@ -85,8 +229,6 @@ class NitroView(LoginRequiredMixin, TemplateView):
         Security: Only allows internal URLs to prevent open redirect attacks.
         External URLs are blocked and will redirect to home instead.
         """
-        from django.utils.http import url_has_allowed_host_and_scheme
-
         # Validate URL is safe (internal only)
         if not url_has_allowed_host_and_scheme(
             url,
@@ -94,9 +236,7 @@ class NitroView(LoginRequiredMixin, TemplateView):
             require_https=self.request.is_secure()
         ):
             # Log attempted redirect to external URL
-            import logging
-            logger = logging.getLogger('security')
-            logger.warning(
+            security_logger.warning(
                 f"Blocked open redirect attempt to: {url} from {self.request.path}"
             )
             url = '/'  # Redirect to home instead
@@ -117,17 +257,13 @@ class NitroView(LoginRequiredMixin, TemplateView):
         Works with the nitro.js toast listener.
         """
         response = HttpResponse(status=204)
-        response['HX-Trigger'] = json.dumps({
-            'showToast': {'message': message, 'type': level}
-        })
+        response['HX-Trigger'] = _toast_trigger(message, level)
         return response
 
     def toast_with_html(self, html, message, level='success'):
         """Return HTML content with a toast trigger."""
         response = HttpResponse(html)
-        response['HX-Trigger'] = json.dumps({
-            'showToast': {'message': message, 'type': level}
-        })
+        response['HX-Trigger'] = _toast_trigger(message, level)
         return response
 
     def success(self, message):
@@ -142,9 +278,12 @@ class NitroListView(NitroView):
 
     model = None
     search_fields = []
+    search_config = 'spanish'
+    use_fulltext = False      # True: ranked tsvector search (add a GinIndex on search_fields)
     filter_fields = []
     sortable_fields = []
     paginate_by = 20
+    paginate_count = True     # False: skip COUNT(*) and paginate with prev/next only
     select_related = []
     prefetch_related = []
     default_sort = '-created_at'
@@ -153,6 +292,15 @@ class NitroListView(NitroView):
     quick_actions = []
     bulk_actions = []
 
+    # Built from self.bulk_actions / self.sortable_fields, which may be set via as_view()
+    @cached_property
+    def _bulk_action_names(self):
+        return frozenset(a.name for a in self.bulk_actions)
+
+    @cached_property
+    def _sortable_set(self):
+        return frozenset(self.sortable_fields or ())
+
     def get_queryset(self):
         """Build the base queryset with select/prefetch related."""
         qs = self.model.objects.all()
@@ -164,30 +312,50 @@ class NitroListView(NitroView):
 
     def apply_search(self, qs):
         """Apply search from ?q= parameter."""
+        if not self.search_fields:
+            return qs
         query = self.request.GET.get('q', '').strip()
-        if not query or not self.search_fields:
+        if not query:
             return qs
 
+        if self.use_fulltext:
+            vector = SearchVector(*self.search_fields, config=self.search_config)
+            search_query = SearchQuery(query, config=self.search_config, search_type='websearch')
+            # Match with @@ on the indexed expression so a GinIndex can serve it
+            return (
+                qs.alias(_search=vector)
+                .filter(_search=search_query)
+                .annotate(_rank=SearchRank(F('_search'), search_query))
+                .order_by('-_rank')
+            )
+
         # Try unaccent search (PostgreSQL) with fallback
         try:
-            q_objects = Q()
-            for field in self.search_fields:
-                q_objects |= Q(**{f'{field}__unaccent__icontains': query})
+            q_objects = reduce(operator.or_, (
+                Q(**{f'{field}__unaccent__icontains': query}) for field in self.search_fields
+            ))
             return qs.filter(q_objects)
         except Exception:
             # Fallback to icontains without unaccent
-            q_objects = Q()
-            for field in self.search_fields:
-                q_objects |= Q(**{f'{field}__icontains': query})
+            q_objects = reduce(operator.or_, (
+                Q(**{f'{field}__icontains': query}) for field in self.search_fields
+            ))
             return qs.filter(q_objects)
 
     def apply_filters(self, qs):
         """Apply filters from query parameters matching filter_fields."""
+        if not self.filter_fields:
+            return qs
+        active = {}
         for field in self.filter_fields:
             value = self.request.GET.get(field, '').strip()
             if value:
-                qs = qs.filter(**{field: value})
-        return qs
+                if _spans_multivalued(qs.model, field):
+                    # Separate filter() so each condition may match a different related row
+                    qs = qs.filter(**{field: value})
+                else:
+                    active[field] = value
+        return qs.filter(**active) if active else qs
 
     def apply_sort(self, qs):
         """Apply sorting from ?sort= parameter."""
@@ -195,8 +363,11 @@ class NitroListView(NitroView):
         if sort:
             # Validate sort field (strip leading -)
             field_name = sort.lstrip('-')
-            if field_name in self.sortable_fields:
+            if field_name in self._sortable_set:
                 return qs.order_by(sort)
+        if '_rank' in qs.query.annotations:
+            # Keep full-text relevance order unless the user picked a sort
+            return qs
         if self.default_sort:
             return qs.order_by(self.default_sort)
         return qs
@@ -213,9 +384,19 @@ class NitroListView(NitroView):
         """Paginate the queryset."""
         if queryset is None:
             queryset = self.get_filtered_queryset()
-        paginator = Paginator(queryset, self.paginate_by)
         page_number = self.request.GET.get('page', 1)
-        return paginator.get_page(page_number)
+        if not self.paginate_count:
+            return CountlessPage.from_queryset(queryset, page_number, self.paginate_by)
+        paginator = Paginator(queryset, self.paginate_by)
+        # Same fallbacks as Paginator.get_page(), without its validate/retry round trips
+        num_pages = paginator.num_pages
+        try:
+            page_number = int(page_number)
+        except (TypeError, ValueError):
+            page_number = 1
+        if not 1 <= page_number <= num_pages:
+            page_number = num_pages
+        return paginator.page(page_number)
 
     def get_filter_options(self):
         """Override to provide filter dropdown options.
@@ -262,17 +443,29 @@ class NitroListView(NitroView):
             context['has_bulk_actions'] = True
         return context
 
+    def get_selected_ids(self):
+        """Parse ?selected_ids= into unique primary keys, dropping invalid values."""
+        to_python = self.model._meta.pk.to_python
+        selected = {}
+        for raw in self.request.POST.getlist('selected_ids'):
+            try:
+                pk = to_python(raw)
+            except ValidationError:
+                continue
+            if pk is not None:
+                selected[pk] = None
+        return list(selected)
+
     def post(self, request, *args, **kwargs):
         """Handle bulk actions."""
         action = request.POST.get('bulk_action', '')
-        selected_ids = request.POST.getlist('selected_ids')
+        selected_ids = self.get_selected_ids()
 
         if not action or not selected_ids:
             return self.toast('Selecciona al menos un elemento', 'warning')
 
         # Validate action exists
-        valid_actions = {a.name for a in self.bulk_actions}
-        if action not in valid_actions:
+        if action not in self._bulk_action_names:
             return self.toast('Acción no válida', 'error')
 
         # Call handler method: handle_bulk_{action}
@@ -300,19 +493,28 @@ class NitroModelView(NitroView):
     tabs = []
     default_tab = None
 
+    _cached_object = None
+
     def get_object(self):
-        pk = self.kwargs.get(self.pk_url_kwarg)
-        return get_object_or_404(self.model, **{self.slug_field: pk})
+        """Fetch the object once per request."""
+        if self._cached_object is None:
+            pk = self.kwargs.get(self.pk_url_kwarg)
+            self._cached_object = get_object_or_404(self.model, **{self.slug_field: pk})
+        return self._cached_object
+
+    @cached_property
+    def _tabs_by_name(self):
+        # First definition wins for duplicate names, as with a linear scan
+        return {tab.name: tab for tab in reversed(self.tabs)}
 
     def get_current_tab(self):
         """Get the current tab from ?tab= parameter, validated against defined tabs."""
         if not self.tabs:
             return None
         tab_name = self.request.GET.get('tab', '').strip()
-        tab_names = {t.name for t in self.tabs}
-        if tab_name in tab_names:
+        if tab_name in self._tabs_by_name:
             return tab_name
-        if self.default_tab and self.default_tab in tab_names:
+        if self.default_tab and self.default_tab in self._tabs_by_name:
             return self.default_tab
         return self.tabs[0].name
 
@@ -324,7 +526,6 @@ class NitroModelView(NitroView):
         if self.tabs:
             current_tab = self.get_current_tab()
             tabs_data = []
-            active_tab_template = None
             for tab in self.tabs:
                 tab_data = {
                     'name': tab.name,
@@ -339,23 +540,18 @@ class NitroModelView(NitroView):
                         tab_data['badge_count'] = tab.badge_count(obj)
                     except Exception:
                         tab_data['badge_count'] = None
-                if tab.name == current_tab:
-                    active_tab_template = tab.template
                 tabs_data.append(tab_data)
 
             context['tabs'] = tabs_data
             context['current_tab'] = current_tab
-            context['active_tab_template'] = active_tab_template
+            context['active_tab_template'] = self._tabs_by_name[current_tab].template
 
         return context
 
     def get_template_names(self):
         # For HTMX tab requests, render only the partial tab template
         if self.is_htmx and self.tabs and self.request.GET.get('tab'):
-            current_tab = self.get_current_tab()
-            for tab in self.tabs:
-                if tab.name == current_tab:
-                    return [tab.template]
+            return [self._tabs_by_name[self.get_current_tab()].template]
         return super().get_template_names()
 
     def get_success_url(self):
@@ -407,7 +603,6 @@ class NitroFormView(NitroView):
         self.object = form.save()
         if self.is_htmx:
             return self.success('Guardado exitosamente')
-        from django.shortcuts import redirect
         return redirect(self.get_success_url())
 
     def form_invalid(self, form):
@@ -487,15 +682,13 @@ class NitroCreateView(NitroFormView):
 
         if self.is_htmx:
             response = HttpResponse(status=204)
-            response['HX-Trigger'] = json.dumps({
-                'showToast': {'message': self.get_success_message(), 'type': 'success'},
-                'closeSlideover': self.get_slideover_id(),
-            })
+            response['HX-Trigger'] = _toast_trigger(
+                self.get_success_message(), close_slideover=self.get_slideover_id(),
+            )
             response['HX-Refresh'] = 'true'
             return response
 
         if self.list_url_name:
-            from django.shortcuts import redirect
             return redirect(self.list_url_name)
         return self.htmx_refresh()
 
@@ -536,6 +729,8 @@ class NitroUpdateView(NitroFormView):
     success_message = None
     pass_company_to_form = True
 
+    _cached_object = None
+
     def get_slideover_id(self):
         if self.slideover_id:
             return self.slideover_id
@@ -551,9 +746,13 @@ class NitroUpdateView(NitroFormView):
         return 'Actualizado exitosamente'
 
     def get_object(self):
-        if hasattr(self, 'get_company_object'):
-            return self.get_company_object(self.model, pk=self.kwargs['pk'])
-        return get_object_or_404(self.model, pk=self.kwargs['pk'])
+        """Fetch the object once per request (form kwargs, context and form_invalid share it)."""
+        if self._cached_object is None:
+            if hasattr(self, 'get_company_object'):
+                self._cached_object = self.get_company_object(self.model, pk=self.kwargs['pk'])
+            else:
+                self._cached_object = get_object_or_404(self.model, pk=self.kwargs['pk'])
+        return self._cached_object
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -572,13 +771,11 @@ class NitroUpdateView(NitroFormView):
         form.save()
         if self.is_htmx:
             response = HttpResponse(status=204)
-            response['HX-Trigger'] = json.dumps({
-                'showToast': {'message': self.get_success_message(), 'type': 'success'},
-                'closeSlideover': self.get_slideover_id(),
-            })
+            response['HX-Trigger'] = _toast_trigger(
+                self.get_success_message(), close_slideover=self.get_slideover_id(),
+            )
             response['HX-Refresh'] = 'true'
             return response
-        from django.shortcuts import redirect
         return redirect(self.request.path)
 
     def form_invalid(self, form):
@@ -659,17 +856,13 @@ class NitroDeleteView(LoginRequiredMixin, View):
         can, error = self.can_delete(obj)
         if not can:
             response = HttpResponse(status=204)
-            response['HX-Trigger'] = json.dumps({
-                'showToast': {'message': error, 'type': 'error'},
-            })
+            response['HX-Trigger'] = _toast_trigger(error, 'error')
             return response
 
         self.perform_delete(obj)
 
         response = HttpResponse(status=204)
-        response['HX-Trigger'] = json.dumps({
-            'showToast': {'message': self.get_success_message(), 'type': 'success'},
-        })
+        response['HX-Trigger'] = _toast_trigger(self.get_success_message())
         if self.redirect_url:
             response['HX-Redirect'] = self.redirect_url
         else:
@@ -681,6 +874,41 @@ class NitroDeleteView(LoginRequiredMixin, View):
 # INLINE EDIT - Edit individual cells in tables
 # =============================================================================
 
+@cache
+def _has_updated_at(model):
+    """Whether ``model`` has an ``updated_at`` field to bump on inline saves."""
+    try:
+        model._meta.get_field('updated_at')
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+_UPDATED_TRIGGER = _toast_trigger('Actualizado')
+_VALIDATION_ERROR_TRIGGERS = {
+    message: _toast_trigger(message, 'error')
+    for message in ('Valor numérico inválido', 'Valor no válido')
+}
+
+
+def _step_quantizer(step):
+    """Decimal to quantize number input to, from an editable field's ``step``."""
+    if step is None:
+        return None
+    try:
+        quantizer = Decimal(str(step))
+    except InvalidOperation:
+        return None  # e.g. step='any'
+    return quantizer if quantizer.is_finite() else None
+
+
+def _is_unchanged(old, new):
+    """Compare a stored value with the submitted one (a str, or Decimal for numbers)."""
+    if old == new:
+        return True
+    return old is not None and new is not None and str(old) == str(new)
+
+
 class NitroInlineEditView(LoginRequiredMixin, View):
     """
     Inline cell editing for NitroListView tables.
@@ -718,23 +946,63 @@ class NitroInlineEditView(LoginRequiredMixin, View):
 
     model = None
     editable_fields = {}  # {field_name: {type, choices?, min?, max?, step?}}
+    use_raw_update = False  # True: save with QuerySet.update() (no save()/signals)
+
+    # Built from self.editable_fields, which may be set per instance via as_view()
+    @cached_property
+    def _valid_choices(self):
+        return {
+            name: frozenset(str(choice[0]) for choice in config['choices'])
+            for name, config in self.editable_fields.items()
+            if config.get('choices')
+        }
+
+    @cached_property
+    def _choice_labels(self):
+        return {
+            name: {str(value): label for value, label in config['choices']}
+            for name, config in self.editable_fields.items()
+            if config.get('choices')
+        }
+
+    @cached_property
+    def _quantizers(self):
+        return {
+            name: quantizer for name, config in self.editable_fields.items()
+            if config.get('type') == 'number'
+            and (quantizer := _step_quantizer(config.get('step'))) is not None
+        }
+
+    def get_queryset(self, only=None):
+        """Base queryset for loading rows; ``only`` limits the columns fetched."""
+        queryset = self.model._default_manager.all()
+        if only:
+            queryset = queryset.only(*only)
+        return queryset
 
     def get_object(self, pk):
         if hasattr(self, 'get_company_object'):
             return self.get_company_object(self.model, pk=pk)
-        return get_object_or_404(self.model, pk=pk)
+        return get_object_or_404(self.get_queryset(), pk=pk)
+
+    def _get_object_for_field(self, pk, field_name):
+        """Load the row with only ``field_name``, unless get_object() is customized."""
+        if (type(self).get_object is not NitroInlineEditView.get_object
+                or hasattr(self, 'get_company_object')):
+            return self.get_object(pk)
+        return get_object_or_404(self.get_queryset(only=(field_name,)), pk=pk)
 
     def get(self, request, pk, field):
         """Return editable input for the field."""
         if field not in self.editable_fields:
             return HttpResponse('Field not editable', status=400)
 
-        obj = self.get_object(pk)
+        # Rendering the input only needs the edited column
+        obj = self._get_object_for_field(pk, field)
         config = self.editable_fields[field]
         current_value = getattr(obj, field, '')
 
-        from django.template.loader import render_to_string
-        html = render_to_string('nitro/components/inline_edit.html', {
+        html = _get_template('nitro/components/inline_edit.html').render({
             'object': obj,
             'field': field,
             'config': config,
@@ -749,49 +1017,71 @@ class NitroInlineEditView(LoginRequiredMixin, View):
         if field not in self.editable_fields:
             return HttpResponse('Field not editable', status=400)
 
-        obj = self.get_object(pk)
+        if self.use_raw_update:
+            obj = self._get_object_for_field(pk, field)
+        else:
+            obj = self.get_object(pk)
         new_value = request.POST.get('value', '').strip()
         config = self.editable_fields[field]
 
         # Basic validation
         try:
             if config.get('type') == 'number':
-                from decimal import Decimal, InvalidOperation
                 try:
-                    new_value = Decimal(new_value) if new_value else None
+                    if new_value:
+                        new_value = Decimal(new_value)
+                        quantizer = self._quantizers.get(field)
+                        if quantizer is not None:
+                            new_value = new_value.quantize(quantizer)
+                    else:
+                        new_value = None
                 except InvalidOperation:
                     return self._error_response('Valor numérico inválido')
 
-            if config.get('choices'):
-                valid_values = [str(c[0]) for c in config['choices']]
-                if str(new_value) not in valid_values:
-                    return self._error_response('Valor no válido')
+            valid_values = self._valid_choices.get(field)
+            if valid_values is not None and str(new_value) not in valid_values:
+                return self._error_response('Valor no válido')
 
-            setattr(obj, field, new_value)
-            obj.save(update_fields=[field, 'updated_at'] if hasattr(obj, 'updated_at') else [field])
+            # Skip the UPDATE (and save signals) when the value didn't change
+            if not _is_unchanged(getattr(obj, field, None), new_value):
+                setattr(obj, field, new_value)
+                if self.use_raw_update:
+                    self.update_object(obj, field)
+                else:
+                    obj.save(update_fields=[field, 'updated_at'] if _has_updated_at(type(obj)) else [field])
 
         except Exception as e:
             return self._error_response(str(e))
 
         # Return updated cell display
-        from django.template.loader import render_to_string
-        html = render_to_string('nitro/components/inline_cell.html', {
+        value = getattr(obj, field)
+        context = {
             'object': obj,
             'field': field,
-            'value': getattr(obj, field),
+            'value': value,
             'config': config,
             'edit_url': request.path,
-        }, request=request)
+        }
+        labels = self._choice_labels.get(field)
+        if labels is not None:
+            context['choice_label'] = labels.get(str(value), '')
+        html = _get_template('nitro/components/inline_cell.html').render(context, request=request)
 
         response = HttpResponse(html)
-        response['HX-Trigger'] = json.dumps({
-            'showToast': {'message': 'Actualizado', 'type': 'success'},
-        })
+        response['HX-Trigger'] = _UPDATED_TRIGGER
         return response
 
+    def update_object(self, obj, field_name):
+        """Write ``field_name`` with a single UPDATE; used when use_raw_update is True."""
+        updates = {field_name: getattr(obj, field_name)}
+        if _has_updated_at(type(obj)):
+            updates['updated_at'] = obj.updated_at = timezone.now()
+        type(obj)._default_manager.filter(pk=obj.pk).update(**updates)
+
     def _error_response(self, message):
         response = HttpResponse(status=422)
-        response['HX-Trigger'] = json.dumps({
-            'showToast': {'message': message, 'type': 'error'},
-        })
+        trigger = _VALIDATION_ERROR_TRIGGERS.get(message)
+        if trigger is None:
+            trigger = _toast_trigger(message, 'error')
+        response['HX-Trigger'] = trigger
         return response
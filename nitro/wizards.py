@@ -24,7 +24,11 @@ Usage:
             return redirect('property_detail', pk=property.pk)
 """
 
+from functools import cache
+
+from django import forms
 from django.shortcuts import redirect
+from django.utils.functional import cached_property
 from .views import NitroView
 
 
@@ -51,6 +55,17 @@ class WizardStep:
         self.condition = condition
 
 
+@cache
+def _form_has_files(form_class):
+    """Whether a form class declares any file fields."""
+    return any(isinstance(f, forms.FileField) for f in form_class.base_fields.values())
+
+
+def _index_steps(steps):
+    # Reversed so the first step with a given name wins, as with a linear scan
+    return {step.name: i for i, step in reversed(list(enumerate(steps)))}
+
+
 class NitroWizard(NitroView):
     """
     Multi-step form wizard with session-based data persistence.
@@ -62,7 +77,23 @@ class NitroWizard(NitroView):
     steps = []
     template_name = 'nitro/wizard/base.html'
 
-    @property
+    # Per-request memos; reset whenever the wizard data is saved or cleared
+    _wizard_data = None
+    _active_steps = None
+    _active_index = None
+    _form = None
+    _form_step = None
+
+    # Derived from self.steps, which may be set per instance via as_view()
+    @cached_property
+    def _has_conditions(self):
+        return any(step.condition for step in self.steps)
+
+    @cached_property
+    def _step_template_names(self):
+        return {step: (step.template,) for step in self.steps if step.template}
+
+    @cached_property
     def session_key(self):
         return f'wizard_{self.wizard_name}'
 
@@ -70,17 +101,25 @@ class NitroWizard(NitroView):
 
     def get_wizard_data(self):
         """Get all wizard data from session."""
-        return self.request.session.get(self.session_key, {})
+        if self._wizard_data is None:
+            self._wizard_data = self.request.session.get(self.session_key, {})
+        return self._wizard_data
 
     def save_wizard_data(self, data):
         """Save wizard data to session."""
         self.request.session[self.session_key] = data
         self.request.session.modified = True
+        self._wizard_data = data
+        self._active_steps = None
+        self._active_index = None
 
     def clear_wizard_data(self):
         """Clear wizard data from session."""
         if self.session_key in self.request.session:
             del self.request.session[self.session_key]
+        self._wizard_data = None
+        self._active_steps = None
+        self._active_index = None
 
     def get_step_data(self, step_name):
         """Get saved data for a specific step."""
@@ -89,6 +128,8 @@ class NitroWizard(NitroView):
     def save_step_data(self, step_name, data):
         """Save data for a specific step."""
         wizard_data = self.get_wizard_data()
+        if step_name in wizard_data and wizard_data[step_name] == data:
+            return  # Unchanged; leave the session unmodified so it isn't re-saved
         wizard_data[step_name] = data
         self.save_wizard_data(wizard_data)
 
@@ -96,21 +137,29 @@ class NitroWizard(NitroView):
 
     def get_active_steps(self):
         """Get list of steps that should be shown (based on conditions)."""
-        wizard_data = self.get_wizard_data()
-        return [
-            step for step in self.steps
-            if step.condition is None or step.condition(wizard_data)
-        ]
+        if not self._has_conditions:
+            return self.steps
+        if self._active_steps is None:
+            wizard_data = self.get_wizard_data()
+            self._active_steps = [
+                step for step in self.steps
+                if step.condition is None or step.condition(wizard_data)
+            ]
+        return self._active_steps
 
     def get_current_step_index(self):
         """Get current step index from ?step= param or default to 0."""
         step_name = self.request.GET.get('step') or self.request.POST.get('current_step')
         if step_name:
-            for i, step in enumerate(self.get_active_steps()):
-                if step.name == step_name:
-                    return i
+            return self.get_active_step_index().get(step_name, 0)
         return 0
 
+    def get_active_step_index(self):
+        """Map active step names to their position in get_active_steps()."""
+        if self._active_index is None:
+            self._active_index = _index_steps(self.get_active_steps())
+        return self._active_index
+
     def get_current_step(self):
         """Get current WizardStep object."""
         steps = self.get_active_steps()
@@ -133,15 +182,24 @@ class NitroWizard(NitroView):
         if not step or not step.form_class:
             return None
 
-        return step.form_class(**self.get_form_kwargs(step))
+        if self._form_step is not step:
+            self._form = step.form_class(**self.get_form_kwargs(step))
+            self._form_step = step
+        return self._form
 
     def get_form_kwargs(self, step):
-        """Get form kwargs, pre-populated with saved data."""
+        """
+        Get form kwargs, pre-populated with saved data.
+
+        Uploaded files are only bound for forms that declare a FileField;
+        override this if a form adds file fields in ``__init__``.
+        """
         kwargs = {'initial': self.get_step_data(step.name)}
 
         if self.request.method == 'POST':
             kwargs['data'] = self.request.POST
-            kwargs['files'] = self.request.FILES
+            if _form_has_files(step.form_class):
+                kwargs['files'] = self.request.FILES
 
         return kwargs
 
@@ -149,10 +207,11 @@ class NitroWizard(NitroView):
 
     def get_template_names(self):
         """Return step-specific template or default."""
-        step = self.get_current_step()
-        if step and step.template:
-            return [step.template]
-        return [self.template_name]
+        names = self._step_template_names.get(self.get_current_step())
+        if names is None:
+            # template_name may be overridden per instance via as_view()
+            return (self.template_name,)
+        return names
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)